@@ -1,22 +1,97 @@
 from __future__ import annotations
 
-import platform
+import bisect
+import os
 import re
-import shutil
-import subprocess
 import sys
+import threading
 import tkinter as tk
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
+from typing import TYPE_CHECKING
 
 from workbench_core import resolve_tool_path
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 # --- Constants for better maintainability ---
 _TOC_WIDTH = 30
+# ToC indentation per heading depth (depth 1 = no indent); deeper levels clamp.
+_TOC_INDENTS = tuple("  " * i for i in range(6))
+_HELP_SIZE = (940, 640)
 _SEARCH_HIGHLIGHT_TAG = "search_hit"
+_SEARCH_ALL_TAG = "search_all"
+_MAX_SEARCH_HIGHLIGHTS = 500
+_SEARCH_BATCH = 1000
 _BOOKMARK_HIGHLIGHT_TAG = "bookmark_hit"
+_SEARCH_DEBOUNCE_MS = 200
+_MIN_INCREMENTAL_QUERY = 2
+_DIAG_POLL_MS = 50
+_LOAD_POLL_MS = 30
+_HEADING_PATTERN = re.compile(r"^(#+)[ \t]+(.*?)[ \t]*$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class _HelpDoc:
+    """A parsed HELP.md: raw text, a lowercased search copy, and (title, line, depth) anchors."""
+
+    content: str
+    content_lower: str
+    anchors: list[tuple[str, int, int]]
+    line_starts: list[int]
+    # Lowercased anchor title -> position in ``anchors`` (first heading wins).
+    title_index: dict[str, int]
+    # (lowercased title, position in ``anchors``) sorted for prefix lookups.
+    sorted_titles: list[tuple[str, int]]
+
+    def index(self, pos: int) -> str:
+        """Converts a character offset into a Tk 'line.column' text index."""
+        line = bisect.bisect_right(self.line_starts, pos)
+        return f"{line}.{pos - self.line_starts[line - 1]}"
+
+    def find_all(self, term: str, start: int = 0, limit: int | None = None) -> list[int]:
+        """Returns offsets of non-overlapping case-insensitive matches of ``term``.
+
+        Scanning begins at ``start`` and stops after ``limit`` hits, if given.
+        """
+        needle = term.lower()
+        hits: list[int] = []
+        if not needle:
+            return hits
+        pos = self.content_lower.find(needle, start)
+        while pos >= 0 and (limit is None or len(hits) < limit):
+            hits.append(pos)
+            pos = self.content_lower.find(needle, pos + len(needle))
+        return hits
+
+    def find_section(self, name: str) -> int | None:
+        """Returns the anchor position for a section title, exact match first, then prefix."""
+        key = name.strip().lower()
+        i = self.title_index.get(key)
+        if i is not None or not key:
+            return i
+        j = bisect.bisect_left(self.sorted_titles, (key,))
+        if j < len(self.sorted_titles) and self.sorted_titles[j][0].startswith(key):
+            return self.sorted_titles[j][1]
+        return None
+
+
+# Parsed HELP.md documents keyed by resolved path: (mtime, document).
+_HELP_CACHE: dict[Path, tuple[float, _HelpDoc]] = {}
+
+# Open help windows keyed by (parent widget path, help file): (window, document,
+# show callback). Closing a help window only hides it so the next open can
+# reuse it as-is; the entry goes away when the window is destroyed.
+_HELP_WINDOWS: dict[
+    tuple[str, str], tuple[tk.Toplevel, _HelpDoc, Callable[[str | None], None]]
+] = {}
+
+# Worker threads for the diagnostics tool probes (created lazily, reused).
+_DIAG_POOL: Executor | None = None
 
 # --- Global variables for app metadata ---
 _APP_NAME = "YT Audio Workbench"
@@ -29,12 +104,19 @@ def set_app_meta(app_name: str, version: str) -> None:
     _APP_NAME, _VERSION = app_name, version
 
 
-def _center_on_screen(win: tk.Toplevel) -> None:
-    """Centers a Toplevel window on the screen."""
+def _center_on_screen(win: tk.Toplevel, size: tuple[int, int] | None = None) -> None:
+    """Centers a Toplevel window on the screen.
+
+    Pass ``size`` when the window geometry is already known to skip the forced
+    layout pass needed to measure it.
+    """
     try:
-        win.update_idletasks()
-        w = win.winfo_width()
-        h = win.winfo_height()
+        if size:
+            w, h = size
+        else:
+            win.update_idletasks()
+            w = win.winfo_width()
+            h = win.winfo_height()
         sw = win.winfo_screenwidth()
         sh = win.winfo_screenheight()
         x = int((sw - w) / 2)
@@ -44,31 +126,123 @@ def _center_on_screen(win: tk.Toplevel) -> None:
         pass
 
 
+def _heading_starts(content: str) -> Iterator[int]:
+    """Yields the offset of every line starting with '#'.
+
+    Only those lines can be headings, so jump between "\\n#" hits with str.find
+    instead of matching the heading pattern against every line.
+    """
+    if content.startswith("#"):
+        yield 0
+    pos = content.find("\n#")
+    while pos >= 0:
+        yield pos + 1
+        pos = content.find("\n#", pos + 1)
+
+
+def _cached_help(help_path: Path) -> _HelpDoc | None:
+    """Returns the cached parse of ``help_path`` if the file is unchanged, else None."""
+    key = help_path.resolve()
+    cached = _HELP_CACHE.get(key)
+    if cached and cached[0] == key.stat().st_mtime:
+        return cached[1]
+    return None
+
+
+def _load_help(help_path: Path) -> _HelpDoc:
+    """Returns the parsed help document, re-reading it only when its mtime changes."""
+    key = help_path.resolve()
+    mtime = key.stat().st_mtime
+    cached = _HELP_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    content = key.read_text(encoding="utf-8")
+    # Search offsets must line up with the text widget, so keep one char per char.
+    content_lower = content.lower()
+    if len(content_lower) != len(content):
+        content_lower = "".join(ch.lower()[:1] for ch in content)
+    line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+    anchors: list[tuple[str, int, int]] = []
+    for start in _heading_starts(content):
+        end = content.find("\n", start)
+        match = _HEADING_PATTERN.match(content, start, len(content) if end < 0 else end)
+        if match:
+            lineno = bisect.bisect_right(line_starts, start)
+            anchors.append((match.group(2).strip(), lineno, len(match.group(1))))
+    title_index: dict[str, int] = {}
+    for i, (title, _lineno, _depth) in enumerate(anchors):
+        title_index.setdefault(title.lower(), i)
+    sorted_titles = sorted((title.lower(), i) for i, (title, _ln, _d) in enumerate(anchors))
+    doc = _HelpDoc(content, content_lower, anchors, line_starts, title_index, sorted_titles)
+    _HELP_CACHE[key] = (mtime, doc)
+    return doc
+
+
 def _tool_info(cmd: str, args: list[str]) -> list[str]:
     """Gathers version information for a given command-line tool."""
-    path = shutil.which(cmd) or resolve_tool_path(cmd)
+    import subprocess  # only needed for diagnostics, keep it off the import path
+
+    path = resolve_tool_path(cmd)
     out: list[str] = [f"{cmd} path: {path or '(not found)'}"]
 
     if not path:
         return out
+
+    # Read just the first line and stop the tool, rather than draining the
+    # rest of its output (ffmpeg prints KBs of build configuration).
+    timeout = 3.0
     try:
-        proc = subprocess.run(
+        proc = subprocess.Popen(
             [path] + args,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            timeout=3,
             encoding='utf-8',
+            errors='replace',
+            # Keep console windows from flashing up for each probe on Windows
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0,
         )
-        first_line = proc.stdout.splitlines()[0].strip() if proc.stdout else "(no output)"
-        out.append(f"{cmd} version: {first_line}")
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+    except OSError as e:
+        out.append(f"{cmd} version: error: {e}")
+        return out
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    try:
+        first_line = proc.stdout.readline().strip() if proc.stdout else ""
+        if not watchdog.is_alive():
+            raise subprocess.TimeoutExpired([path] + args, timeout)
+        out.append(f"{cmd} version: {first_line or '(no output)'}")
+    except (subprocess.TimeoutExpired, OSError) as e:
         out.append(f"{cmd} version: error: {e}")
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        if proc.stdout:
+            proc.stdout.close()
+        proc.wait()
     return out
 
 
+def _diagnostics_pool() -> Executor:
+    """Returns the shared worker pool for diagnostics probes, created on first use."""
+    global _DIAG_POOL
+    if _DIAG_POOL is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _DIAG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="diagnostics")
+    return _DIAG_POOL
+
+
 def _copy_diagnostics(parent: tk.Misc, get_text: Callable[[str, str], str]) -> None:
-    """Collects and copies system/tool diagnostic info to the clipboard."""
+    """Collects and copies system/tool diagnostic info to the clipboard.
+
+    The tool probes run on worker threads; the clipboard is filled from the Tk
+    thread once they have all finished, so the UI stays responsive meanwhile.
+    """
+    import platform
+
     lines: list[str] = [
         f"{_APP_NAME} v{_VERSION}".strip(),
         f"Python: {sys.version.splitlines()[0]}",
@@ -76,27 +250,38 @@ def _copy_diagnostics(parent: tk.Misc, get_text: Callable[[str, str], str]) -> N
     ]
     tool_checks = [
         ("yt-dlp", ["--version"]),
-        ("ffmpeg", ["-version"]),
-        ("ffprobe", ["-version"]),
+        ("ffmpeg", ["-hide_banner", "-version"]),
+        ("ffprobe", ["-hide_banner", "-version"]),
         ("mp3gain", ["-v"]),
     ]
-    for tool, args in tool_checks:
-        lines.extend(_tool_info(tool, args))
+    pool = _diagnostics_pool()
+    futures = [pool.submit(_tool_info, tool, args) for tool, args in tool_checks]
 
-    try:
-        parent.clipboard_clear()
-        parent.clipboard_append("\n".join(lines))
-        messagebox.showinfo(
-            get_text("help.diag_copied_title", "Diagnostics"),
-            get_text("help.diag_copied_msg", "Diagnostic info copied to clipboard."),
-            parent=parent,
-        )
-    except tk.TclError:
-        messagebox.showwarning(
-            get_text("help.diag_copy_failed_title", "Clipboard Error"),
-            get_text("help.diag_copy_failed_msg", "Could not copy to clipboard."),
-            parent=parent,
-        )
+    def finish() -> None:
+        if not all(f.done() for f in futures):
+            parent.after(_DIAG_POLL_MS, finish)
+            return
+        for (tool, _args), fut in zip(tool_checks, futures, strict=True):
+            try:
+                lines.extend(fut.result())
+            except Exception as e:
+                lines.append(f"{tool} version: error: {e}")
+        try:
+            parent.clipboard_clear()
+            parent.clipboard_append("\n".join(lines))
+            messagebox.showinfo(
+                get_text("help.diag_copied_title", "Diagnostics"),
+                get_text("help.diag_copied_msg", "Diagnostic info copied to clipboard."),
+                parent=parent,
+            )
+        except tk.TclError:
+            messagebox.showwarning(
+                get_text("help.diag_copy_failed_title", "Clipboard Error"),
+                get_text("help.diag_copy_failed_msg", "Could not copy to clipboard."),
+                parent=parent,
+            )
+
+    parent.after(_DIAG_POLL_MS, finish)
 
 
 def open_help_window(
@@ -106,10 +291,32 @@ def open_help_window(
     section: str | None = None,
 ) -> None:
     """Opens a help window rendering the HELP.md text with a navigable ToC."""
+    title = get_text("dialog.help.title", f"Help — {_APP_NAME}").format(app=_APP_NAME)
+
+    key = (str(parent), str(help_path))
+    existing = _HELP_WINDOWS.pop(key, None)
+    if existing:
+        old_top, old_doc, show_existing = existing
+        try:
+            if old_top.winfo_exists():
+                try:
+                    fresh = _cached_help(help_path) is old_doc
+                except OSError:
+                    fresh = False  # help file deleted or unreadable
+                if fresh:
+                    _HELP_WINDOWS[key] = existing
+                    old_top.title(title)
+                    show_existing(section)
+                    return
+                # The help file changed on disk since the window was built;
+                # never leave the hidden window behind
+                old_top.destroy()
+        except tk.TclError:
+            pass
+
     top = tk.Toplevel(parent)
-    title = get_text("dialog.help.title", f"Help — {_APP_NAME}")
-    top.title(title.format(app=_APP_NAME))
-    top.geometry("940x640")
+    top.title(title)
+    top.geometry("{}x{}".format(*_HELP_SIZE))
     top.transient(parent)
 
     container = ttk.Frame(top, padding=8)
@@ -132,104 +339,245 @@ def open_help_window(
     toc_listbox = tk.Listbox(body_frame, width=_TOC_WIDTH)
     toc_listbox.grid(row=0, column=0, sticky="ns", padx=(0, 8))
 
-    text_widget = ScrolledText(body_frame, wrap="word", padx=5, pady=5)
+    text_widget = ScrolledText(
+        body_frame, wrap="word", padx=5, pady=5, undo=False, autoseparators=False, maxundo=0
+    )
     text_widget.grid(row=0, column=1, sticky="nsew")
 
+    text_widget.tag_configure(_SEARCH_ALL_TAG, background="#fff5b0")
     text_widget.tag_configure(_SEARCH_HIGHLIGHT_TAG, background="yellow", foreground="black")
     text_widget.tag_configure(_BOOKMARK_HIGHLIGHT_TAG, background="#e0e8f0")
 
-    try:
-        content = help_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-        text_widget.insert("1.0", content)
-    except OSError as e:
-        text_widget.insert("1.0", f"Failed to load help file '{help_path}':\n\n{e}")
-        _center_on_screen(top)
-        top.grab_set()
-        return
-
-    anchors: list[tuple[str, int, int]] = []
-    heading_pattern = re.compile(r"^(#+)\s+(.*)")
-    for i, line in enumerate(lines, start=1):
-        match = heading_pattern.match(line)
-        if match:
-            depth = len(match.group(1))
-            title = match.group(2).strip()
-            anchors.append((title, i, depth))
-            indent = "  " * (depth - 1)
-            toc_listbox.insert("end", f"{indent}{title}")
-
-    def do_search(start_pos: str = "1.0"):
-        text_widget.tag_remove(_SEARCH_HIGHLIGHT_TAG, "1.0", "end")
+    # Set once the document is loaded; until then the handlers below are no-ops.
+    doc: _HelpDoc | None = None
+
+    # Highlight tags currently applied somewhere, so clearing an unused tag
+    # skips the Tk round-trip (and its sweep over the whole buffer).
+    tagged: set[str] = set()
+
+    def add_tag(tag: str, *ranges: str):
+        text_widget.tag_add(tag, *ranges)
+        tagged.add(tag)
+
+    def clear_tag(tag: str):
+        if tag in tagged:
+            text_widget.tag_remove(tag, "1.0", "end")
+            tagged.discard(tag)
+
+    # Offset just past the current search hit; searches run against the cached
+    # lowercase copy of the document instead of pulling the buffer out of Tk.
+    search_from = 0
+    # Match offsets for the last searched term, so Find Next is a bisect. They
+    # are collected in batches as navigation needs them, which bounds the work
+    # for very common (e.g. short) terms.
+    hits_term = ""
+    hits: list[int] = []
+    hits_complete = True
+
+    def clear_search_hits():
+        nonlocal hits_term, hits, hits_complete
+        clear_tag(_SEARCH_ALL_TAG)
+        hits_term, hits, hits_complete = "", [], True
+
+    def more_hits(term: str) -> bool:
+        nonlocal hits_complete
+        from_pos = hits[-1] + len(term) if hits else 0
+        batch = doc.find_all(term, from_pos, _SEARCH_BATCH)
+        hits.extend(batch)
+        hits_complete = len(batch) < _SEARCH_BATCH
+        return bool(batch)
+
+    def highlight_all(term_len: int):
+        # Tag every match (capped) in a single Tk call; the current one gets
+        # the stronger search_hit tag on top.
+        ranges: list[str] = []
+        for pos in hits[:_MAX_SEARCH_HIGHLIGHTS]:
+            ranges += (doc.index(pos), doc.index(pos + term_len))
+        if ranges:
+            add_tag(_SEARCH_ALL_TAG, *ranges)
+
+    def do_search(start: int = 0, notify: bool = True) -> int | None:
+        nonlocal search_from, hits_term
+        clear_tag(_SEARCH_HIGHLIGHT_TAG)
         term = query_var.get()
-        if not term:
+        if not term or doc is None:
+            clear_search_hits()
             return None
-        pos = text_widget.search(term, start_pos, stopindex="end", nocase=True)
-        if pos:
-            end_pos = f"{pos}+{len(term)}c"
-            text_widget.tag_add(_SEARCH_HIGHLIGHT_TAG, pos, end_pos)
-            text_widget.see(pos)
+        if term.lower() != hits_term:
+            clear_search_hits()
+            hits_term = term.lower()
+            more_hits(term)
+            highlight_all(len(term))
+        i = bisect.bisect_left(hits, start)
+        while i == len(hits) and not hits_complete and more_hits(term):
+            i = bisect.bisect_left(hits, start)
+        pos = hits[i] if i < len(hits) else -1
+        if pos >= 0:
+            search_from = pos + len(term)
+            start_idx = doc.index(pos)
+            add_tag(_SEARCH_HIGHLIGHT_TAG, start_idx, doc.index(search_from))
+            text_widget.see(start_idx)
             query_entry.focus_set()
             return pos
-        if start_pos == "1.0":
+        search_from = 0
+        if start == 0 and notify:
             messagebox.showinfo("Search", f"Term not found: '{term}'", parent=top)
         return None
 
+    # Search-as-you-type runs once typing pauses, not on every keystroke.
+    pending_search: str | None = None
+
+    def cancel_pending_search():
+        nonlocal pending_search
+        if pending_search:
+            top.after_cancel(pending_search)
+            pending_search = None
+
+    def incremental_search():
+        nonlocal pending_search
+        pending_search = None
+        if top.winfo_exists() and len(query_var.get()) >= _MIN_INCREMENTAL_QUERY:
+            do_search(0, notify=False)
+
+    def schedule_search(*_args):
+        nonlocal pending_search
+        cancel_pending_search()
+        pending_search = top.after(_SEARCH_DEBOUNCE_MS, incremental_search)
+
     def find_next():
-        last_hit = text_widget.tag_ranges(_SEARCH_HIGHLIGHT_TAG)
-        start_pos = last_hit[1] if last_hit else "1.0"
-        if not do_search(start_pos):
-            do_search("1.0")
+        cancel_pending_search()
+        start = search_from
+        if do_search(start) is None and start:
+            do_search(0)
 
     find_next_button = ttk.Button(search_frame, text="Find Next", command=find_next)
     find_next_button.pack(side="left", padx=6)
     query_entry.bind("<Return>", lambda e: find_next())
+    query_var.trace_add("write", schedule_search)
 
     def jump_to_selection(event=None):
+        nonlocal search_from
         # 1. Get the currently selected item in the listbox.
         selections = toc_listbox.curselection()
         if not selections:
             return
 
         # 2. Clear ALL previous highlights for a clean slate.
-        text_widget.tag_remove(_BOOKMARK_HIGHLIGHT_TAG, "1.0", "end")
-        text_widget.tag_remove(_SEARCH_HIGHLIGHT_TAG, "1.0", "end")
+        clear_tag(_BOOKMARK_HIGHLIGHT_TAG)
+        clear_tag(_SEARCH_HIGHLIGHT_TAG)
+        clear_search_hits()
+        search_from = 0
 
         # 3. Get the line number for the selected bookmark.
         idx = selections[0]
-        _title, lineno, _depth = anchors[idx]
+        _title, lineno, _depth = doc.anchors[idx]
         line_index = f"{lineno}.0"
 
         # 4. Apply the new highlight to the line.
-        text_widget.tag_add(_BOOKMARK_HIGHLIGHT_TAG, line_index, f"{line_index} lineend")
-
-        # --- NEW RELIABLE SCROLL-TO-TOP LOGIC ---
-        # A. First, scroll to the VERY BOTTOM to ensure the target is above the viewport.
-        text_widget.yview_moveto(1.0)
-
-        # B. Now, use .see(), which will be forced to place the line at the top.
-        text_widget.see(line_index)
+        add_tag(_BOOKMARK_HIGHLIGHT_TAG, line_index, f"{line_index} lineend")
 
-        # C. Ensure the UI updates smoothly.
-        text_widget.update_idletasks()
+        # 5. Scroll so the heading is the top line of the viewport. 'yview index'
+        #    does this in one step, without a forced relayout.
+        text_widget.mark_set("insert", line_index)
+        text_widget.yview(line_index)
 
     # This crucial line connects listbox clicks to the jump_to_selection function.
     toc_listbox.bind("<<ListboxSelect>>", jump_to_selection)
 
     def jump_to_section_by_name(name: str):
-        for i, (title, _ln, _depth) in enumerate(anchors):
-            if title.lower().strip() == name.lower().strip():
-                toc_listbox.selection_clear(0, "end")
-                toc_listbox.selection_set(i)
-                toc_listbox.activate(i)
-                jump_to_selection()
-                break
+        i = doc.find_section(name) if doc else None
+        if i is not None:
+            toc_listbox.selection_clear(0, "end")
+            toc_listbox.selection_set(i)
+            toc_listbox.activate(i)
+            jump_to_selection()
+
+    def populate(loaded: _HelpDoc):
+        # Filled in once the window is on screen so large files don't delay
+        # its first paint.
+        nonlocal doc
+        doc = loaded
+        _HELP_WINDOWS[key] = (top, doc, show)
+        text_widget.delete("1.0", "end")
+        text_widget.insert("1.0", doc.content, ())
+        text_widget.edit_reset()
+        text_widget.mark_set("insert", "1.0")
+        text_widget.configure(state="disabled")
+        # One Tcl call for the whole ToC instead of one per heading.
+        toc_items = [
+            _TOC_INDENTS[min(depth, len(_TOC_INDENTS)) - 1] + title
+            for title, _lineno, depth in doc.anchors
+        ]
+        if toc_items:
+            toc_listbox.insert("end", *toc_items)
+        if section:
+            top.after_idle(jump_to_section_by_name, section)
+
+    def load_failed(e: OSError):
+        text_widget.delete("1.0", "end")
+        text_widget.insert("1.0", f"Failed to load help file '{help_path}':\n\n{e}")
 
-    if section:
-        top.after(100, lambda: jump_to_section_by_name(section))
+    def load_in_background():
+        # Read and parse off the Tk thread; the Tk side polls for the result.
+        result: list[_HelpDoc | OSError] = []
+
+        def work():
+            try:
+                result.append(_load_help(help_path))
+            except OSError as e:
+                result.append(e)
+
+        def check():
+            if not top.winfo_exists():
+                return
+            if not result:
+                top.after(_LOAD_POLL_MS, check)
+            elif isinstance(result[0], OSError):
+                load_failed(result[0])
+            else:
+                populate(result[0])
+
+        text_widget.insert("1.0", "Loading…")
+        threading.Thread(target=work, name="help-loader", daemon=True).start()
+        top.after(_LOAD_POLL_MS, check)
+
+    def show(target: str | None) -> None:
+        top.deiconify()
+        top.lift()
+        top.grab_set()
+        query_entry.focus_set()
+        if target:
+            jump_to_section_by_name(target)
+
+    def hide() -> None:
+        cancel_pending_search()
+        if doc is None:
+            # Nothing worth keeping (still loading, or the load failed)
+            top.destroy()
+            return
+        top.grab_release()
+        top.withdraw()
 
-    _center_on_screen(top)
+    def forget(event: tk.Event) -> None:
+        # <Destroy> also fires for every child widget; only the window counts.
+        entry = _HELP_WINDOWS.get(key)
+        if event.widget is top and entry and entry[0] is top:
+            del _HELP_WINDOWS[key]
+
+    top.protocol("WM_DELETE_WINDOW", hide)
+    top.bind("<Destroy>", forget, add="+")
+
+    _center_on_screen(top, _HELP_SIZE)
     top.grab_set()
+    try:
+        cached = _cached_help(help_path)
+    except OSError as e:
+        load_failed(e)
+        return
+    if cached:
+        top.after_idle(populate, cached)
+    else:
+        load_in_background()
 
 
 def show_about_dialog(
@@ -1,9 +1,44 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from jsonio import json_loads
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file straight from bytes (orjson when installed)."""
+    return json_loads(path.read_bytes())
+
+
+def _flatten(data: dict[str, Any], prefix: str, out: dict[str, str]) -> None:
+    """Collect scalar leaves of a nested dict into 'a.b.c' -> str(value)."""
+    for k, v in data.items():
+        if isinstance(v, dict):
+            _flatten(v, f"{prefix}{k}.", out)
+        elif isinstance(v, str | int | float):
+            out[f"{prefix}{k}"] = str(v)
+
+
+# Parsed locale files keyed by resolved path: (mtime, nested data, flattened table).
+# Shared by all Language instances so switching back to a locale is a dict hit.
+_TABLES: dict[Path, tuple[float, dict[str, Any], dict[str, str]]] = {}
+
+
+def _load_table(path: Path) -> tuple[dict[str, Any], dict[str, str]]:
+    """Return (data, flat) for a locale file, re-parsing only when its mtime changes."""
+    key = path.resolve()
+    mtime = key.stat().st_mtime
+    cached = _TABLES.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    data = _read_json(key)
+    flat: dict[str, str] = {}
+    if isinstance(data, dict):
+        _flatten(data, "", flat)
+    _TABLES[key] = (mtime, data, flat)
+    return data, flat
+
 
 class Language:
     """Tiny JSON-based language lookup with dot-path keys, e.g. 'tooltips.sample_rate'."""
@@ -12,39 +47,41 @@ class Language:
         self.lang_dir = Path(lang_dir)
         self.code = code
         self._data: dict[str, Any] = {}
+        # Dot-path -> string, flattened once per load so get() is a single lookup
+        self._flat: dict[str, str] = {}
+        # English table for keys missing from the active locale (loaded on first miss)
+        self._fallback: dict[str, str] | None = None
+        self._locales_cache: tuple[float, dict[str, Path]] | None = None
         self.load(self.code)
 
     def load(self, code: str) -> None:
-        self._data = {}
+        self.code = code
         try:
-            path = self.lang_dir / f"{code}.json"
-            with open(path, encoding="utf-8") as f:
-                self._data = json.load(f)
+            self._data, self._flat = _load_table(self.lang_dir / f"{code}.json")
         except Exception:
-            # fall back to English if not present
-            if code != "en":
-                try:
-                    with open(self.lang_dir / "en.json", encoding="utf-8") as f:
-                        self._data = json.load(f)
-                except Exception:
-                    self._data = {}
+            # Missing/broken locale: every lookup falls through to English
+            self._data, self._flat = {}, {}
+        self._fallback = {} if code == "en" else None
 
     def get(self, key: str, default: str | None = None) -> str | None:
-        # Resolve dot path
-        cur: Any = self._data
-        for part in key.split("."):
-            if isinstance(cur, dict) and part in cur:
-                cur = cur[part]
-            else:
-                return default
-        if isinstance(cur, str | int | float):
-            return str(cur)
-        return default
+        value = self._flat.get(key)
+        if value is not None:
+            return value
+        if self._fallback is None:
+            try:
+                self._fallback = _load_table(self.lang_dir / "en.json")[1]
+            except Exception:
+                self._fallback = {}
+        return self._fallback.get(key, default)
 
     def available_locales(self) -> dict[str, Path]:
-        locales: dict[str, Path] = {}
-        if not self.lang_dir.exists():
-            return locales
-        for p in self.lang_dir.glob("*.json"):
-            locales[p.stem] = p
-        return locales
+        try:
+            mtime = self.lang_dir.stat().st_mtime
+        except OSError:
+            return {}
+        # Adding/removing a locale file bumps the directory mtime
+        if self._locales_cache and self._locales_cache[0] == mtime:
+            return dict(self._locales_cache[1])
+        locales = {p.stem: p for p in sorted(self.lang_dir.iterdir()) if p.suffix == ".json"}
+        self._locales_cache = (mtime, locales)
+        return dict(locales)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional faster parser
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    _orjson = None
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else the stdlib json module."""
+    return _orjson.loads(raw) if _orjson else json.loads(raw)
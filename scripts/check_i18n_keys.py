@@ -7,39 +7,40 @@ Fail if locale JSON files in lang/ don’t share the same leaf keys.
 """
 
 from __future__ import annotations
-import json, sys
+import sys
 from pathlib import Path
-from collections.abc import Iterable
 
 ROOT = Path(__file__).resolve().parents[1]
 LANG_DIR = ROOT / "lang"
 
-
-def load_json(p: Path):
-    return json.loads(p.read_text(encoding="utf-8"))
-
-
-def walk_leaves(d: dict, prefix: tuple[str, ...] = ()) -> Iterable[tuple[tuple[str, ...], str]]:
-    for k, v in d.items():
-        if isinstance(v, dict):
-            yield from walk_leaves(v, prefix + (k,))
-        else:
-            yield (prefix + (k,)), v
+# Reuse the shared JSON loader (orjson when installed) instead of a copy of it
+sys.path.insert(0, str(ROOT))
+from jsonio import json_loads
 
 
-def walk_shapes(
-    d: dict, prefix: tuple[str, ...] = (), out: dict[tuple[str, ...], str] | None = None
-):
-    if out is None:
-        out = {}
-    for k, v in d.items():
-        path = prefix + (k,)
-        if isinstance(v, dict):
-            out[path] = "dict"
-            walk_shapes(v, path, out)
-        else:
-            out[path] = "leaf"
-    return out
+def load_json(p: Path):
+    return json_loads(p.read_bytes())
+
+
+def collect(obj: dict) -> tuple[set[tuple[str, ...]], dict[tuple[str, ...], str]]:
+    """Return (leaf paths, {path: "dict" | "leaf"}) in one pass over the tree.
+
+    Paths stay tuples so a literal "a.b" key never collides with a nested a -> b.
+    """
+    leaves: set[tuple[str, ...]] = set()
+    shapes: dict[tuple[str, ...], str] = {}
+    stack: list[tuple[tuple[str, ...], dict]] = [((), obj)]
+    while stack:
+        prefix, d = stack.pop()
+        for k, v in d.items():
+            path = prefix + (k,)
+            if isinstance(v, dict):
+                shapes[path] = "dict"
+                stack.append((path, v))
+            else:
+                shapes[path] = "leaf"
+                leaves.add(path)
+    return leaves, shapes
 
 
 def main() -> int:
@@ -52,12 +53,13 @@ def main() -> int:
         print("No locale files found in lang/.", file=sys.stderr)
         return 1
 
-    data = {p.name: load_json(p) for p in locales}
-    leaf_sets = {name: {path for path, _ in walk_leaves(obj)} for name, obj in data.items()}
-    shapes = {name: walk_shapes(obj) for name, obj in data.items()}
-
-    # Union of all leaf paths across locales
-    union_leaves = set().union(*leaf_sets.values())
+    # One pass per locale fills its leaf set, its shape map and the union
+    leaf_sets: dict[str, set[tuple[str, ...]]] = {}
+    shapes: dict[str, dict[tuple[str, ...], str]] = {}
+    union_leaves: set[tuple[str, ...]] = set()
+    for p in locales:
+        leaf_sets[p.name], shapes[p.name] = collect(load_json(p))
+        union_leaves |= leaf_sets[p.name]
 
     ok = True
 
@@ -70,17 +72,16 @@ def main() -> int:
             for m in missing:
                 print(f"  - {m}")
 
-    # Check for structural inconsistencies (leaf in one, dict in another)
-    # Build a union of all paths seen in any shape map.
-    union_paths = set().union(*[set(s.keys()) for s in shapes.values()])
-    for path in sorted(union_paths):
-        shapes_here = {name: s.get(path) for name, s in shapes.items() if path in s}
-        if len(set(shapes_here.values())) > 1:
-            ok = False
-            dotted = ".".join(path)
-            print(f"\n[FAIL] Structural mismatch at '{dotted}':")
-            for name, kind in sorted(shapes_here.items()):
-                print(f"  - {name}: {kind}")
+    # Check for structural inconsistencies (leaf in one, dict in another):
+    # exactly the paths that are a dict in some locale and a leaf in another.
+    union_dicts = set().union(*(set(s) - leaf_sets[name] for name, s in shapes.items()))
+    for path in sorted(union_dicts & union_leaves):
+        ok = False
+        dotted = ".".join(path)
+        print(f"\n[FAIL] Structural mismatch at '{dotted}':")
+        for name, s in sorted(shapes.items()):
+            if path in s:
+                print(f"  - {name}: {s[path]}")
 
     if ok:
         print("[OK] i18n key sets match across locales.")
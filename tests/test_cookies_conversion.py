@@ -31,3 +31,12 @@ def test_cookie_editor_json_to_netscape(tmp_path):
     txt = out.read_text(encoding="utf-8")
     assert "Netscape HTTP Cookie File" in txt
     assert "example.com" in txt
+
+
+def test_cookie_fields_escape_separators(tmp_path):
+    src = tmp_path / "cookies.json"
+    data = [{"domain": ".example.com", "name": "a\tb", "value": "x\r\ny"}]
+    src.write_text(json.dumps(data), encoding="utf-8")
+    out = core.convert_cookie_editor_json_to_netscape(src, tmp_path / "c.txt", log=None)
+    row = out.read_text(encoding="utf-8").splitlines()[-1]
+    assert row.split("\t")[-2:] == ["a%09b", "x%0D%0Ay"]
@@ -0,0 +1,143 @@
+import os
+
+import pytest
+
+import help_window as hw
+
+
+def test_load_help_caches_until_file_changes(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("# Title\n\nIntro\n\n## Troubleshooting\nText\n", encoding="utf-8")
+
+    doc = hw._load_help(help_md)
+    assert doc.anchors == [("Title", 1, 1), ("Troubleshooting", 5, 2)]
+    assert doc.content_lower == doc.content.lower()
+    assert doc.title_index == {"title": 0, "troubleshooting": 1}
+    # A second load is served from the cache
+    assert hw._load_help(help_md) is doc
+
+    # Bumping the mtime invalidates the cached entry
+    help_md.write_text("# Other\n", encoding="utf-8")
+    st = help_md.stat()
+    os.utime(help_md, (st.st_atime, st.st_mtime + 5))
+    doc = hw._load_help(help_md)
+    assert doc.content == "# Other\n"
+    assert doc.anchors == [("Other", 1, 1)]
+
+
+def test_load_help_lowercase_copy_keeps_offsets(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("# İstanbul\nFOO\n", encoding="utf-8")
+
+    doc = hw._load_help(help_md)
+    assert len(doc.content_lower) == len(doc.content)
+    assert doc.content_lower.find("foo") == doc.content.find("FOO")
+
+
+def test_help_doc_index_maps_offsets_to_tk_indices(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("# A\nab\n\ncd\n", encoding="utf-8")
+
+    doc = hw._load_help(help_md)
+    assert doc.index(0) == "1.0"
+    assert doc.index(doc.content.find("b")) == "2.1"
+    assert doc.index(doc.content.find("cd")) == "4.0"
+
+
+def test_load_help_heading_scan_edge_cases(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("#not-a-heading\ntext # inline\n### Deep  \n## Last", encoding="utf-8")
+
+    doc = hw._load_help(help_md)
+    assert doc.anchors == [("Deep", 3, 3), ("Last", 4, 2)]
+
+
+def test_help_doc_find_section_exact_then_prefix(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text(
+        "# Help\n## Troubleshooting\n### Tool Not Found Errors\n## Tools\n", encoding="utf-8"
+    )
+
+    doc = hw._load_help(help_md)
+    assert doc.find_section(" troubleshooting ") == 1
+    assert doc.find_section("Tools") == 3
+    assert doc.find_section("tool not") == 2
+    assert doc.find_section("missing") is None
+    assert doc.find_section("") is None
+
+
+def test_help_doc_find_all_is_case_insensitive_and_non_overlapping(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("# FFmpeg\nffmpeg aaaa FFMPEG\n", encoding="utf-8")
+
+    doc = hw._load_help(help_md)
+    assert doc.find_all("ffmpeg") == [2, 9, 21]
+    assert doc.find_all("aa") == [16, 18]
+    assert doc.find_all("") == []
+
+
+def test_cached_help_only_returns_fresh_entries(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("# A\n", encoding="utf-8")
+
+    assert hw._cached_help(help_md) is None
+    doc = hw._load_help(help_md)
+    assert hw._cached_help(help_md) is doc
+
+    st = help_md.stat()
+    os.utime(help_md, (st.st_atime, st.st_mtime + 5))
+    assert hw._cached_help(help_md) is None
+
+
+def test_help_doc_find_all_in_batches(tmp_path):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("ab " * 10, encoding="utf-8")
+
+    doc = hw._load_help(help_md)
+    first = doc.find_all("ab", limit=4)
+    assert first == [0, 3, 6, 9]
+    rest = doc.find_all("ab", first[-1] + 2)
+    assert first + rest == doc.find_all("ab")
+
+
+class _FakeTop:
+    def __init__(self):
+        self.destroyed = False
+
+    def winfo_exists(self):
+        return not self.destroyed
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class _StopBuild(Exception):
+    pass
+
+
+@pytest.mark.parametrize("change", ["deleted", "modified"])
+def test_open_help_window_destroys_stale_hidden_window(monkeypatch, tmp_path, change):
+    help_md = tmp_path / "HELP.md"
+    help_md.write_text("# A\n", encoding="utf-8")
+    doc = hw._load_help(help_md)
+    parent = "parent"
+    key = (str(parent), str(help_md))
+    old_top = _FakeTop()
+    monkeypatch.setitem(hw._HELP_WINDOWS, key, (old_top, doc, lambda section: None))
+
+    if change == "deleted":
+        help_md.unlink()
+    else:
+        st = help_md.stat()
+        os.utime(help_md, (st.st_atime, st.st_mtime + 5))
+
+    # Stop right where a fresh window would be built (no display needed)
+    def no_toplevel(*args, **kwargs):
+        raise _StopBuild
+
+    monkeypatch.setattr(hw.tk, "Toplevel", no_toplevel)
+    with pytest.raises(_StopBuild):
+        hw.open_help_window(parent, help_md, lambda key, default: default)
+
+    assert old_top.destroyed
+    assert key not in hw._HELP_WINDOWS
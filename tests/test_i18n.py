@@ -0,0 +1,56 @@
+import json
+from i18n import Language
+
+
+def test_get_resolves_dot_paths(tmp_path):
+    data = {"app_title": "App", "menu": {"help": "Help", "count": 3, "sub": {"x": "X"}}}
+    (tmp_path / "en.json").write_text(json.dumps(data), encoding="utf-8")
+
+    lang = Language(tmp_path, code="en")
+    assert lang.get("app_title") == "App"
+    assert lang.get("menu.help") == "Help"
+    assert lang.get("menu.count") == "3"
+    assert lang.get("menu.sub.x") == "X"
+    # Dicts and missing keys fall back to the default
+    assert lang.get("menu", "d") == "d"
+    assert lang.get("menu.nope", "d") == "d"
+
+
+def test_load_falls_back_to_english(tmp_path):
+    (tmp_path / "en.json").write_text(json.dumps({"a": {"b": "B"}}), encoding="utf-8")
+
+    lang = Language(tmp_path, code="xx")
+    assert lang.get("a.b") == "B"
+
+
+def test_switching_back_reuses_parsed_table(tmp_path):
+    (tmp_path / "en.json").write_text(json.dumps({"a": "A"}), encoding="utf-8")
+    (tmp_path / "fr.json").write_text(json.dumps({"a": "Á"}), encoding="utf-8")
+
+    lang = Language(tmp_path, code="en")
+    first = lang._flat
+    lang.load("fr")
+    assert lang.code == "fr"
+    assert lang.get("a") == "Á"
+    lang.load("en")
+    assert lang._flat is first
+
+
+def test_missing_keys_fall_back_to_english_per_key(tmp_path):
+    (tmp_path / "en.json").write_text(json.dumps({"a": "A", "b": "B"}), encoding="utf-8")
+    (tmp_path / "fr.json").write_text(json.dumps({"a": "Á"}), encoding="utf-8")
+
+    lang = Language(tmp_path, code="fr")
+    assert lang.get("a") == "Á"
+    assert lang.get("b") == "B"
+    assert lang.get("c", "d") == "d"
+
+
+def test_available_locales_lists_json_files(tmp_path):
+    (tmp_path / "en.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "fr.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+
+    lang = Language(tmp_path, code="en")
+    assert sorted(lang.available_locales()) == ["en", "fr"]
+    assert Language(tmp_path / "missing").available_locales() == {}
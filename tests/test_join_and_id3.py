@@ -49,14 +49,15 @@ def test_join_via_wav_then_lame_mock(monkeypatch, tmp_path):
     # This list will track calls to our mock function
     call_log = []
 
-    def mock_run_quiet(cmd, cwd=None, env=None):
+    def mock_run_quiet(cmd, cwd=None, env=None, input=None):
         # Log the command that was run
         call_log.append(cmd)
         # The last argument is the output file; simulate its creation
         Path(cmd[-1]).touch()
-        return 0  # Return success code
+        return 0, ""  # run_quiet returns (rc, stderr_tail)
 
     monkeypatch.setattr(core, "run_quiet", mock_run_quiet)
+    monkeypatch.setattr(core, "_probe_stream_format", lambda p: ("mp3", 44100, 2))
 
     # Create dummy source files for the function to join
     source_files = [tmp_path / "1.mp3", tmp_path / "2.mp3"]
@@ -76,6 +77,252 @@ def test_join_via_wav_then_lame_mock(monkeypatch, tmp_path):
     # 1. Assert that the function returned the correct final path
     assert result_path == tmp_path / "final_album.mp3"
 
-    # 2. Assert that ffmpeg was called the correct number of times
-    #    (once for each source file + once for concat + once for final encode)
-    assert len(call_log) == len(source_files) + 2
+    # 2. Assert that a single ffmpeg run decodes, concatenates and encodes
+    assert len(call_log) == 1
+    assert call_log[0][:4] == ["ffmpeg", "-y", "-f", "concat"]
+
+
+def test_join_concat_list_keeps_order_and_quotes(monkeypatch, tmp_path):
+    lists = []
+
+    def mock_run_quiet(cmd, cwd=None, env=None, input=None):
+        assert cmd[cmd.index("-i") + 1] == "pipe:0"
+        lists.append(input.decode("utf-8"))
+        return 0, ""
+
+    monkeypatch.setattr(core, "run_quiet", mock_run_quiet)
+    monkeypatch.setattr(core, "_probe_stream_format", lambda p: ("mp3", 44100, 2))
+
+    source_files = [tmp_path / "b.mp3", tmp_path / "it's a.mp3"]
+    for f in source_files:
+        f.touch()
+
+    core.join_via_wav_then_lame(
+        files=source_files, outdir=tmp_path, sr=44100, br_kbps=192, join_name="j", log=print
+    )
+
+    base = tmp_path.resolve().as_posix()
+    assert lists == [f"file 'file:{base}/b.mp3'\nfile 'file:{base}/it'\\''s a.mp3'\n"]
+    assert set(tmp_path.iterdir()) == set(source_files)  # no list file on disk
+
+
+def test_join_matching_mp3s_are_stream_copied(monkeypatch, tmp_path):
+    call_log = []
+
+    def mock_run_quiet(cmd, cwd=None, env=None, input=None):
+        call_log.append(cmd)
+        return 0, ""
+
+    monkeypatch.setattr(core, "run_quiet", mock_run_quiet)
+    monkeypatch.setattr(core, "_probe_stream_format", lambda p: ("mp3", 44100, 2))
+    monkeypatch.setattr(core, "_mp3_stream_params", lambda p: (44100, 2, 192))
+
+    source_files = [tmp_path / "1.mp3", tmp_path / "2.mp3"]
+    for f in source_files:
+        f.touch()
+
+    core.join_via_wav_then_lame(
+        files=source_files, outdir=tmp_path, sr=44100, br_kbps=192, join_name="j", log=print
+    )
+    core.join_via_wav_then_lame(
+        files=source_files, outdir=tmp_path, sr=48000, br_kbps=192, join_name="j", log=print
+    )
+
+    assert len(call_log) == 2
+    assert call_log[0][-3:] == ["-c", "copy", str(tmp_path / "j.mp3")]
+    assert "libmp3lame" in call_log[1]  # target rate differs: re-encode
+
+
+def test_join_mixed_formats_use_concat_filter(monkeypatch, tmp_path):
+    call_log = []
+
+    def mock_run_quiet(cmd, cwd=None, env=None, input=None):
+        call_log.append(cmd)
+        return 0, ""
+
+    monkeypatch.setattr(core, "run_quiet", mock_run_quiet)
+
+    source_files = [tmp_path / "1.mp3", tmp_path / "2.m4a"]
+    for f in source_files:
+        f.touch()
+
+    core.join_via_wav_then_lame(
+        files=source_files, outdir=tmp_path, sr=44100, br_kbps=192, join_name="j", log=print
+    )
+
+    assert len(call_log) == 1
+    cmd = call_log[0]
+    assert cmd[cmd.index("-filter_complex") + 1] == "[0:a][1:a]concat=n=2:v=0:a=1[a]"
+
+
+def test_join_concat_filter_batches_large_inputs(monkeypatch, tmp_path):
+    calls = []
+
+    def mock_run_quiet(cmd, cwd=None, env=None, input=None):
+        calls.append((cmd, input))
+        return 0, ""
+
+    monkeypatch.setattr(core, "run_quiet", mock_run_quiet)
+    monkeypatch.setattr(core, "_CONCAT_FILTER_MAX_INPUTS", 2)
+
+    source_files = [tmp_path / f"{i}.{ext}" for i, ext in enumerate("mp3 m4a mp3 m4a mp3".split())]
+    for f in source_files:
+        f.touch()
+
+    core.join_via_wav_then_lame(
+        files=source_files, outdir=tmp_path, sr=44100, br_kbps=192, join_name="j", log=print
+    )
+
+    *batches, (final, concat_list) = calls
+    # Three concat-filter runs of at most two inputs, each to a PCM WAV ...
+    assert [cmd.count("-i") for cmd, _ in batches] == [2, 2, 1]
+    assert sorted(cmd[cmd.index("-i") + 1] for cmd, _ in batches) == [
+        str(source_files[0]),
+        str(source_files[2]),
+        str(source_files[4]),
+    ]
+    assert all(cmd[-1].endswith(".wav") and "pcm_s16le" in cmd for cmd, _ in batches)
+    # ... then one demuxer run over the batch WAVs, in order, encoding the MP3
+    wavs = sorted(cmd[-1] for cmd, _ in batches)
+    assert concat_list.decode().splitlines() == [
+        f"file 'file:{Path(w).resolve().as_posix()}'" for w in wavs
+    ]
+    assert "libmp3lame" in final and final[-1] == str(tmp_path / "j.mp3")
+
+
+def test_join_mismatched_stream_params_use_concat_filter(monkeypatch, tmp_path):
+    call_log = []
+
+    def mock_run_quiet(cmd, cwd=None, env=None, input=None):
+        call_log.append(cmd)
+        return 0, ""
+
+    rates = {"1.m4a": 44100, "2.m4a": 48000}
+    monkeypatch.setattr(core, "run_quiet", mock_run_quiet)
+    monkeypatch.setattr(core, "_probe_stream_format", lambda p: ("aac", rates[p.name], 2))
+
+    source_files = [tmp_path / "1.m4a", tmp_path / "2.m4a"]
+    for f in source_files:
+        f.touch()
+
+    core.join_via_wav_then_lame(
+        files=source_files, outdir=tmp_path, sr=44100, br_kbps=192, join_name="j", log=print
+    )
+
+    # Same suffix, different sample rates: never hand these to the concat demuxer
+    assert len(call_log) == 1
+    assert "concat" not in call_log[0][:4]
+    assert "-filter_complex" in call_log[0]
+
+
+def test_ffprobe_durations_cached_per_file_version(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_probe(path, log):
+        calls.append(path.name)
+        return 12.5
+
+    monkeypatch.setattr(core, "_ffprobe_duration_seconds", fake_probe)
+    monkeypatch.setattr(core, "_DURATION_CACHE", {})
+
+    parts = [tmp_path / "1.mp3", tmp_path / "2.mp3"]
+    for f in parts:
+        f.write_bytes(b"x")
+
+    assert core._ffprobe_durations(parts, print) == {parts[0]: 12.5, parts[1]: 12.5}
+    assert core._ffprobe_durations(parts, print) == {parts[0]: 12.5, parts[1]: 12.5}
+    assert sorted(calls) == ["1.mp3", "2.mp3"]
+
+    # A rewritten file is probed again
+    parts[1].write_bytes(b"longer")
+    core._ffprobe_durations(parts, print)
+    assert sorted(calls) == ["1.mp3", "2.mp3", "2.mp3"]
+
+
+def test_duration_cache_is_bounded_lru(monkeypatch, tmp_path):
+    monkeypatch.setattr(core, "_ffprobe_duration_seconds", lambda path, log: 1.0)
+    monkeypatch.setattr(core, "_DURATION_CACHE", {})
+    monkeypatch.setattr(core, "_FILE_CACHE_MAX", 2)
+
+    a, b, c = parts = [tmp_path / "a.mp3", tmp_path / "b.mp3", tmp_path / "c.mp3"]
+    for f in parts:
+        f.write_bytes(b"x")
+
+    core._ffprobe_durations([a, b], print)
+    core._ffprobe_durations([a], print)  # a is now the most recently used
+    core._ffprobe_durations([c], print)
+
+    assert [k[0].name for k in core._DURATION_CACHE] == ["a.mp3", "c.mp3"]
+
+
+def test_tag_cache_is_bounded(monkeypatch, tmp_path):
+    monkeypatch.setattr(core, "_ffprobe_duration_seconds", lambda path, log: 1.0)
+    monkeypatch.setattr(core, "_DURATION_CACHE", {})
+    monkeypatch.setattr(core, "_TAG_CACHE", {})
+    monkeypatch.setattr(core, "_FILE_CACHE_MAX", 2)
+
+    parts = [tmp_path / f"{n}.mp3" for n in "abc"]
+    for f in parts:
+        f.write_bytes(b"x")
+
+    core._collect_part_meta(parts, print)
+
+    assert [k[0].name for k in core._TAG_CACHE] == ["b.mp3", "c.mp3"]
+
+
+def test_part_meta_reads_tags_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(core, "ensure_mutagen_installed", lambda log: True)
+    monkeypatch.setattr(core, "_ffprobe_duration_seconds", lambda path, log: 3.0)
+    monkeypatch.setattr(core, "_DURATION_CACHE", {})
+    monkeypatch.setattr(core, "_TAG_CACHE", {})
+
+    tagged = tmp_path / "Artist Name - Song Title.mp3"
+    tagged.write_bytes(b"dummy mp3 data")
+    core.write_id3_tags_mutagen(files=[tagged], album="A", log=print)
+    untagged = tmp_path / "plain.mp3"
+    untagged.write_bytes(b"x")
+
+    parts = [tagged, untagged]
+    meta = core._collect_part_meta(parts, print)
+    assert meta == {tagged: ("Song Title", "Artist Name", 3.0), untagged: ("plain", "", 3.0)}
+
+    import mutagen.id3
+
+    def no_parse(*a, **k):
+        raise AssertionError("ID3 parsed again")
+
+    monkeypatch.setattr(mutagen.id3, "ID3", no_parse)
+    assert core._collect_part_meta(parts, print) == meta
+
+
+def test_mp3_duration_skips_ffprobe(monkeypatch, tmp_path):
+    def no_ffprobe(*a, **k):
+        raise AssertionError("ffprobe spawned")
+
+    monkeypatch.setattr(core, "run_capture", no_ffprobe)
+
+    # 100 MPEG-1 Layer III frames at 128 kbps / 44.1 kHz, about 2.6 s
+    mp3 = tmp_path / "tone.mp3"
+    mp3.write_bytes((b"\xff\xfb\x90\x64" + b"\x00" * 413) * 100)
+    assert abs(core._ffprobe_duration_seconds(mp3, print) - 2.6) < 0.05
+
+
+def test_embed_id3_chapters_from_running_total(monkeypatch, tmp_path):
+    monkeypatch.setattr(core, "_ffprobe_duration_seconds", lambda path, log: 1.0004)
+    monkeypatch.setattr(core, "_DURATION_CACHE", {})
+    monkeypatch.setattr(core, "_TAG_CACHE", {})
+
+    parts = [tmp_path / f"{i}.wav" for i in range(1, 4)]
+    for f in parts:
+        f.write_bytes(b"x")
+    joined = tmp_path / "joined.mp3"
+    joined.write_bytes(b"dummy mp3 data")
+
+    core.embed_id3_chapters(joined, parts, print)
+
+    chaps = sorted(ID3(joined).getall("CHAP"), key=lambda c: c.start_time)
+    assert [c.element_id for c in chaps] == ["chp1", "chp2", "chp3"]
+    assert ID3(joined).getall("CTOC")[0].child_element_ids == ["chp1", "chp2", "chp3"]
+    # 0.4 ms per part must not be rounded away track by track
+    assert [(c.start_time, c.end_time) for c in chaps] == [(0, 1000), (1000, 2001), (2001, 3001)]
+    assert chaps[1].sub_frames["TIT2"].text[0] == "2"
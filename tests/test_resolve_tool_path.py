@@ -23,6 +23,47 @@ def test_resolve_prefers_path(monkeypatch, tmp_path):
         return None
 
     monkeypatch.setattr(shutil, "which", fake_which)
+    core.clear_tool_cache()
     # We don't assert OS-specific branches; just ensure PATH hit is respected
     assert core.resolve_tool_path("yt-dlp") == "/usr/local/bin/yt-dlp"
     assert called["which"] >= 1
+
+
+def test_resolve_caches_until_cleared(monkeypatch):
+    calls = []
+
+    def fake_which(cmd):
+        calls.append(cmd)
+        return "/opt/bin/" + cmd
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+    core.clear_tool_cache()
+    assert core.resolve_tool_path("ffprobe") == "/opt/bin/ffprobe"
+    assert core.have("ffprobe") is True
+    assert calls == ["ffprobe"]
+
+    core.clear_tool_cache()
+    core.resolve_tool_path("ffprobe")
+    assert calls == ["ffprobe", "ffprobe"]
+    core.clear_tool_cache()
+
+
+def test_resolve_falls_back_to_install_dirs(monkeypatch, tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir()
+    b.mkdir()
+    (b / ("ffmpeg" + core._TOOL_SUFFIX)).touch()
+    (b / ("ffprobe" + core._TOOL_SUFFIX)).touch()
+
+    monkeypatch.setattr(shutil, "which", lambda cmd: None)
+    monkeypatch.setattr(core, "_TOOL_DIRS", (str(a), str(b)))
+    core.clear_tool_cache()
+    try:
+        assert core.resolve_tool_path("ffmpeg") == str(b / ("ffmpeg" + core._TOOL_SUFFIX))
+        assert core.resolve_tool_path("ffprobe") == str(b / ("ffprobe" + core._TOOL_SUFFIX))
+        assert core.resolve_tool_path("mp3gain") is None
+        # Repeat lookups are answered from the cache without probing again
+        monkeypatch.setattr(core.os.path, "isfile", lambda p: 1 / 0)
+        assert core.resolve_tool_path("ffmpeg") == str(b / ("ffmpeg" + core._TOOL_SUFFIX))
+    finally:
+        core.clear_tool_cache()
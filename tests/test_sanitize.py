@@ -0,0 +1,68 @@
+import pytest
+
+import workbench_core as core
+
+# The case-sensitive halves need a filesystem that really is case-sensitive
+case_sensitive_fs = pytest.mark.skipif(
+    core._FS_CASE_INSENSITIVE, reason="host filesystem ignores case"
+)
+
+
+def test_sanitize_filename_component():
+    assert core._sanitize_filename_component('AC/DC: "Live" [2001] #1') == "AC-DC Live 2001 1"
+    assert core._sanitize_filename_component("a\x00b\tc   d") == "abc d"
+    assert core._sanitize_filename_component(" ..--?? ") == "untitled"
+
+
+def test_sanitize_and_rename_avoids_collisions(tmp_path):
+    names = ["a?b.mp3", "a-b.mp3", "a&b.mp3", "ok.mp3"]
+    for n in names:
+        (tmp_path / n).write_text(n)
+
+    out = core._sanitize_and_rename([tmp_path / n for n in names], log=print)
+
+    assert [p.name for p in out] == ["a-b_1.mp3", "a-b.mp3", "a-b_2.mp3", "ok.mp3"]
+    assert {p.name: p.read_text() for p in out} == {
+        "a-b_1.mp3": "a?b.mp3",
+        "a-b.mp3": "a-b.mp3",
+        "a-b_2.mp3": "a&b.mp3",
+        "ok.mp3": "ok.mp3",
+    }
+
+
+@case_sensitive_fs
+def test_sanitize_and_rename_case_only_twins(monkeypatch, tmp_path):
+    (tmp_path / "a-b.mp3").write_text("sibling")
+    src = tmp_path / "A?b.mp3"
+    src.write_text("src")
+
+    # Case-sensitive filesystem: a name differing only by case is free
+    monkeypatch.setattr(core, "_FS_CASE_INSENSITIVE", False)
+    (out,) = core._sanitize_and_rename([src], log=print)
+    assert out.name == "A-b.mp3"
+
+    # Case-insensitive filesystem: the same name would clobber the sibling
+    monkeypatch.setattr(core, "_FS_CASE_INSENSITIVE", True)
+    (tmp_path / "B?c.mp3").write_text("src2")
+    (tmp_path / "b-c.mp3").write_text("sibling2")
+    (out,) = core._sanitize_and_rename([tmp_path / "B?c.mp3"], log=print)
+    assert out.name == "B-c_1.mp3"
+
+
+@case_sensitive_fs
+def test_dedup_artist_case_only_twin(monkeypatch, tmp_path):
+    (tmp_path / "artist - song.mp3").write_text("sibling")
+    src = tmp_path / "Artist - Artist - song.mp3"
+    src.write_text("src")
+
+    monkeypatch.setattr(core, "_FS_CASE_INSENSITIVE", False)
+    (out,) = core._dedup_artist_in_filenames([src], log=print)
+    assert out.name == "Artist - song.mp3"
+    assert out.read_text() == "src"
+
+    monkeypatch.setattr(core, "_FS_CASE_INSENSITIVE", True)
+    src2 = tmp_path / "Other - Other - x.mp3"
+    src2.write_text("src2")
+    (tmp_path / "other - x.mp3").write_text("sibling2")
+    (out,) = core._dedup_artist_in_filenames([src2], log=print)
+    assert out == src2  # skipped rather than replacing the case-only twin
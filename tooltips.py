@@ -13,6 +13,9 @@ from collections.abc import Callable
 from typing import Any
 from weakref import WeakKeyDictionary
 
+# While a tip is visible it follows the pointer by polling at this interval
+_POINTER_POLL_MS = 33
+
 
 class TooltipManager:
     def __init__(self, delay_ms: int = 500, wrap: int = 420) -> None:
@@ -21,49 +24,87 @@ class TooltipManager:
 
         # Weak maps keyed by widget objects to avoid keeping dead widgets alive
         self._providers: "WeakKeyDictionary[tk.Misc, Callable[[], str]]" = WeakKeyDictionary()
+        self._static_texts: "WeakKeyDictionary[tk.Misc, str]" = WeakKeyDictionary()
         self._after_ids: "WeakKeyDictionary[tk.Misc, str]" = WeakKeyDictionary()
 
+        # One bindtag per manager carries the <Enter>/<Leave>/<Destroy> handlers,
+        # so each tooltipped widget costs a bindtags() call, not three bindings.
+        # The class bindings are registered lazily on the first attach.
+        self._bindtag = f"Tooltip{id(self):x}"
+        self._class_root: tk.Misc | None = None
+
         self._tip_win: tk.Toplevel | None = None
         self._label: ttk.Label | None = None
         self._current_widget: tk.Misc | None = None
 
+        # Pointer-follow loop, only running while a tip is shown
+        self._poll_id: str | None = None
+        self._tip_pos: tuple[int, int] | None = None
+        # (text, wrap) last applied to the label
+        self._label_state: tuple[str, int] | None = None
+
     # ---------------------------
     # Public API
     # ---------------------------
     def attach_tooltip(self, widget: tk.Misc, text_or_callable: Any) -> None:
         """Attach a tooltip to 'widget' with a string or zero-arg callable."""
+        # Plain strings are stored as-is; only real callables are called per show
         if callable(text_or_callable):
             self._providers[widget] = text_or_callable
+            self._static_texts.pop(widget, None)
         else:
-            s = str(text_or_callable)
-            self._providers[widget] = lambda s=s: s
-
-        widget.bind("<Enter>", self._on_enter, add="+")
-        widget.bind("<Leave>", self._on_leave, add="+")
-        widget.bind("<Destroy>", self._on_destroy, add="+")
-        widget.bind("<Motion>", self._on_motion, add="+")
+            self._static_texts[widget] = str(text_or_callable)
+            self._providers.pop(widget, None)
+
+        self._ensure_class_bindings(widget)
+        tags = widget.bindtags()
+        if self._bindtag not in tags:
+            # Right after the widget's own tag, so a "break" returned by a class,
+            # toplevel or "all" binding can't swallow the tooltip's Enter/Leave
+            own = str(widget)
+            i = tags.index(own) + 1 if own in tags else 0
+            widget.bindtags(tags[:i] + (self._bindtag,) + tags[i:])
 
     def reset(self) -> None:
-        """Cancel all pending callbacks and hide/destroy any tooltip window.
+        """Cancel all pending callbacks and destroy the tooltip window.
         Call this before you destroy/rebuild the UI (e.g., language switch)."""
-        # Cancel all after() callbacks we know about
-        try:
-            for w, aid in list(self._after_ids.items()):
+        # Cancel all after() callbacks we know about, then empty the maps in place
+        for w, aid in list(self._after_ids.items()):
+            try:
+                if w and w.winfo_exists():
+                    w.after_cancel(aid)
+            except Exception:
+                pass
+        self._after_ids.clear()
+
+        # Forget all providers
+        self._providers.clear()
+        self._static_texts.clear()
+
+        # Drop the tooltip window; the next hover builds a fresh one
+        self._current_widget = None
+        self._teardown()
+
+        # Release the class bindings; the next attach registers them again
+        root, self._class_root = self._class_root, None
+        if root is not None:
+            for seq in ("<Enter>", "<Leave>", "<Destroy>"):
                 try:
-                    if w and w.winfo_exists():
-                        w.after_cancel(aid)
+                    root.unbind_class(self._bindtag, seq)
                 except Exception:
                     pass
+
+    def _ensure_class_bindings(self, widget: tk.Misc) -> None:
+        try:
+            if self._class_root is not None and self._class_root.winfo_exists():
+                return
         except Exception:
             pass
-        self._after_ids = WeakKeyDictionary()  # fresh
-
-        # Forget all providers
-        self._providers = WeakKeyDictionary()
-
-        # Hide any visible tooltip
-        self._current_widget = None
-        self._hide()
+        root = widget.winfo_toplevel()
+        root.bind_class(self._bindtag, "<Enter>", self._on_enter)
+        root.bind_class(self._bindtag, "<Leave>", self._on_leave)
+        root.bind_class(self._bindtag, "<Destroy>", self._on_destroy)
+        self._class_root = root
 
     # ---------------------------
     # Event handlers
@@ -89,20 +130,31 @@ class TooltipManager:
             return
         self._cancel_scheduled(w)
         try:
-            if w in self._providers:
-                del self._providers[w]
+            self._providers.pop(w, None)
+            self._static_texts.pop(w, None)
         except Exception:
             pass
         if self._current_widget is w:
             self._current_widget = None
         self._hide()
 
-    def _on_motion(self, e: tk.Event) -> None:
-        if self._tip_win and self._tip_win.winfo_exists():
-            try:
-                self._tip_win.geometry(f"+{e.x_root + 12}+{e.y_root + 12}")
-            except Exception:
-                pass
+    def _poll_pointer(self) -> None:
+        # Replaces per-widget <Motion> bindings: one timer, and only while visible
+        self._poll_id = None
+        w = self._current_widget
+        if w is None or not self._tip_win:
+            return
+        try:
+            if not self._tip_win.winfo_exists():
+                return
+            x, y = w.winfo_pointerxy()
+            pos = (x + 12, y + 12)
+            if pos != self._tip_pos:
+                self._tip_win.geometry(f"+{pos[0]}+{pos[1]}")
+                self._tip_pos = pos
+            self._poll_id = self._tip_win.after(_POINTER_POLL_MS, self._poll_pointer)
+        except Exception:
+            pass
 
     # ---------------------------
     # Core logic
@@ -125,30 +177,37 @@ class TooltipManager:
                 pass
 
     def _resolve_text(self, widget: tk.Misc) -> str:
+        s = self._static_texts.get(widget)
+        if s is not None:
+            return s
         prov = self._providers.get(widget)
         if not prov:
             return ""
         try:
-            return str(prov() or "")
+            v = prov()
+            return v if isinstance(v, str) else str(v or "")
         except Exception:
             return ""
 
     def _show(self, widget: tk.Misc) -> None:
+        if self._current_widget is not widget:
+            return
+        # Resolve first: an empty tooltip needs no Tk round-trips at all
+        text = self._resolve_text(widget)
+        if not text:
+            return
         try:
-            if self._current_widget is not widget:
-                return
             if not widget.winfo_exists() or not widget.winfo_viewable():
                 return
         except Exception:
             return
 
-        text = self._resolve_text(widget)
-        if not text:
-            return
-
+        # Built once, then withdrawn/deiconified across hovers
         if not self._tip_win or not self._tip_win.winfo_exists():
             try:
-                self._tip_win = tk.Toplevel(widget)
+                self._tip_win = tk.Toplevel(widget.winfo_toplevel())
+                # Stay unmapped until positioned so the first show maps it once
+                self._tip_win.withdraw()
                 self._tip_win.wm_overrideredirect(True)
                 try:
                     self._tip_win.attributes("-topmost", True)
@@ -158,25 +217,49 @@ class TooltipManager:
                 frame.pack(fill="both", expand=True)
                 self._label = ttk.Label(frame, text="", justify="left", padding=(6, 4))
                 self._label.pack(fill="both", expand=True)
+                self._label_state = None
             except Exception:
                 return
 
         try:
             if not self._label or not self._label.winfo_exists():
                 return
-            self._label.configure(text=text, wraplength=self.wrap)
+            # Re-hovering the same widget leaves the label as it is
+            if self._label_state != (text, self.wrap):
+                self._label.configure(text=text, wraplength=self.wrap)
+                self._label_state = (text, self.wrap)
         except (TclError, Exception):
             return
 
         try:
-            x = widget.winfo_pointerx() + 12
-            y = widget.winfo_pointery() + 12
+            x, y = widget.winfo_pointerxy()
+            x += 12
+            y += 12
             self._tip_win.geometry(f"+{x}+{y}")
+            self._tip_pos = (x, y)
             self._tip_win.deiconify()
+            if self._poll_id is None:
+                self._poll_id = self._tip_win.after(_POINTER_POLL_MS, self._poll_pointer)
         except Exception:
             pass
 
     def _hide(self) -> None:
+        if self._poll_id is not None:
+            try:
+                if self._tip_win:
+                    self._tip_win.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._tip_pos = None
+        try:
+            if self._tip_win and self._tip_win.winfo_exists():
+                self._tip_win.withdraw()
+        except Exception:
+            pass
+
+    def _teardown(self) -> None:
+        self._hide()
         try:
             if self._tip_win and self._tip_win.winfo_exists():
                 self._tip_win.destroy()
@@ -2,11 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 from collections.abc import Callable
+from types import ModuleType
 
 import tkinter as tk
-from tkinter import ttk, simpledialog
-
-from help_window import open_help_window, show_about_dialog, set_app_meta, _copy_diagnostics
+from tkinter import ttk
 
 # Re-exported tooltip settings; if not available, provide fallbacks.
 try:
@@ -23,7 +22,15 @@ except Exception:  # pragma: no cover
 
     def get_tooltip_settings() -> tuple[int, int]:  # noqa: D401 - trivial shim
         """Return default delay/wrap when tooltips module not present."""
-        return (500, 60)
+        return (500, 420)
+
+
+def _help(app_name: str, version: str) -> ModuleType:
+    """Import help_window on first use (menu clicks only) and stamp the app meta."""
+    import help_window
+
+    help_window.set_app_meta(app_name, version)
+    return help_window
 
 
 def _t(parent: tk.Misc, key: str, default: str, get_text: Callable[[str, str], str] | None) -> str:
@@ -40,7 +47,10 @@ def add_help_right_aligned_menu(
     on_switch_language: Callable[[str], None] | None = None,
 ) -> tk.Frame:
     """Create a thin, right-aligned Help menu strip with original layout/behavior."""
-    set_app_meta(app_name, version)
+    tr = get_text or (lambda _k, d: d)
+
+    def _open_help(_e: tk.Event | None = None) -> None:
+        _help(app_name, version).open_help_window(parent, help_md_path, tr)
 
     # Restore pre-GitHub behavior: create and PACK the bar here
     bar = ttk.Frame(parent)
@@ -53,19 +63,21 @@ def add_help_right_aligned_menu(
     if help_md_path is not None:
         menu.add_command(
             label=_t(parent, "menu.open_help", "Open Help", get_text),
-            command=lambda: open_help_window(parent, help_md_path, get_text or (lambda _k, d: d)),
+            command=_open_help,
         )
 
     # 2) Copy diagnostics (restored to the menu)
     menu.add_command(
         label=_t(parent, "menu.copy_diagnostics", "Copy diagnostic info", get_text),
-        command=lambda: _copy_diagnostics(parent, get_text or (lambda _k, d: d)),
+        command=lambda: _help(app_name, version)._copy_diagnostics(parent, tr),
     )
 
     # 3) Tooltips submenu (manual number inputs like before)
     tips_menu = tk.Menu(menu, tearoff=False)
 
     def _set_delay() -> None:
+        from tkinter import simpledialog
+
         cur_delay, _cur_wrap = get_tooltip_settings()
         val = simpledialog.askinteger(
             title=_t(parent, "menu.tooltips.delay", "Tooltip delay", get_text),
@@ -83,6 +95,8 @@ def add_help_right_aligned_menu(
                 pass
 
     def _set_wrap() -> None:
+        from tkinter import simpledialog
+
         _cur_delay, cur_wrap = get_tooltip_settings()
         val = simpledialog.askinteger(
             title=_t(parent, "menu.tooltips.wrap", "Tooltip wrap", get_text),
@@ -118,11 +132,7 @@ def add_help_right_aligned_menu(
 
     # 5) About (at the bottom, match original order)
     def _about() -> None:
-        try:
-            set_app_meta(app_name, version)
-        except Exception:
-            pass
-        show_about_dialog(parent, help_md_path or Path("HELP.md"), get_text or (lambda _k, d: d))
+        _help(app_name, version).show_about_dialog(parent, help_md_path or Path("HELP.md"), tr)
 
     menu.add_separator()
     menu.add_command(label=_t(parent, "menu.about", "About", get_text), command=_about)
@@ -133,10 +143,7 @@ def add_help_right_aligned_menu(
     # F1 opens full help (restored)
     try:
         if help_md_path is not None:
-            parent.bind_all(
-                "<F1>",
-                lambda e: open_help_window(parent, help_md_path, get_text or (lambda _k, d: d)),
-            )
+            parent.bind_all("<F1>", _open_help)
     except Exception:
         pass
 
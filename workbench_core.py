@@ -4,11 +4,11 @@ from __future__ import annotations
 """
 Core helpers used by the GUI and tests.
 
-- Tool resolution: resolve_tool_path(), have()
+- Tool resolution: resolve_tool_path(), have(), clear_tool_cache()
 - Subprocess helpers: _run_capture(), run_capture(), run_quiet()
 - Cancellation: CANCEL_EVENT, process tracking, terminate_all_procs()
 - Cookies: _convert_cookie_editor_json_to_netscape(), prepare_cookies()
-- Audio: join_via_wav_then_lame(), write_id3_tags()
+- Audio: join_via_wav_then_lame(), write_id3_tags_mutagen()
 - Minimal task runner surface so the GUI can import: ProcessingOptions, run_processing_task()
 
 Everything is written conservatively to satisfy ruff (E,F,I,UP) and Pylance.
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from collections.abc import Callable
 
+import functools
+import itertools
 import json
 import queue
 import re
@@ -27,23 +29,21 @@ import random
 import signal
 import sys
 import subprocess
+import tempfile
 import threading
 import time
+import weakref
 import http.cookiejar as _cj
+from concurrent.futures import ThreadPoolExecutor
 
-# Global registry of running child processes
-_CURRENT_PROCS_LOCK = threading.RLock()
-_CURRENT_PROCS: set[subprocess.Popen] = set()
-
-
-def _register_proc(p: subprocess.Popen) -> None:
-    with _CURRENT_PROCS_LOCK:
-        _CURRENT_PROCS.add(p)
-
+from jsonio import json_loads
 
-def _unregister_proc(p: subprocess.Popen) -> None:
-    with _CURRENT_PROCS_LOCK:
-        _CURRENT_PROCS.discard(p)
+# Global registry of running child processes. Unlocked: add/discard/copy of a
+# set of identity-hashed objects are single atomic operations under the GIL.
+_CURRENT_PROCS: set[subprocess.Popen] = set()
+# Windows children started without a console: CTRL_BREAK_EVENT can't reach them,
+# so cancellation falls back to terminate()
+_NO_CONSOLE_PROCS: weakref.WeakSet[subprocess.Popen] = weakref.WeakSet()
 
 
 # -----------------------
@@ -111,7 +111,9 @@ def _spawn_process(cmd: list[str], **kwargs) -> subprocess.Popen:
         kwargs.setdefault("preexec_fn", os.setsid)
 
     p = subprocess.Popen(cmd, **kwargs)  # nosec: trusted argv list
-    _register_proc(p)
+    _CURRENT_PROCS.add(p)
+    if os.name == "nt" and kwargs["creationflags"] & _CREATE_NO_WINDOW:
+        _NO_CONSOLE_PROCS.add(p)
     return p
 
 
@@ -126,7 +128,42 @@ def spawn_streaming(cmd: list[str], **kwargs) -> subprocess.Popen:
 
 def finalize_process(p: subprocess.Popen) -> None:
     """Remove a child from the registry after it exits (GUI streaming case)."""
-    _unregister_proc(p)
+    _CURRENT_PROCS.discard(p)
+
+
+def _wait_pidfds(procs: list[subprocess.Popen], deadline: float) -> bool:
+    """Linux: wait for all children at once on pidfds until exit or deadline.
+    Returns False when pidfds are unavailable so the caller polls instead."""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    import select
+
+    fds: dict[int, subprocess.Popen] = {}
+    try:
+        for p in procs:
+            if p.poll() is None:
+                fds[os.pidfd_open(p.pid)] = p
+        poller = select.poll()
+        for fd in fds:
+            poller.register(fd, select.POLLIN)
+        pending = set(fds)
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            for fd, _ev in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                pending.discard(fd)
+                fds[fd].poll()  # reap
+        return True
+    except OSError:
+        return False
+    finally:
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
 
 def terminate_all_procs(timeout: float = 3.0) -> None:
@@ -134,8 +171,7 @@ def terminate_all_procs(timeout: float = 3.0) -> None:
     Try graceful shutdown of all registered children, then escalate.
     Safe to call multiple times.
     """
-    with _CURRENT_PROCS_LOCK:
-        procs = list(_CURRENT_PROCS)
+    procs = list(_CURRENT_PROCS)
 
     # 1) Graceful
     for p in procs:
@@ -143,7 +179,10 @@ def terminate_all_procs(timeout: float = 3.0) -> None:
             if p.poll() is not None:
                 continue
             if os.name == "nt":
-                p.send_signal(signal.CTRL_BREAK_EVENT)
+                if p in _NO_CONSOLE_PROCS:
+                    p.terminate()
+                else:
+                    p.send_signal(signal.CTRL_BREAK_EVENT)
             else:
                 # signal whole group
                 os.killpg(os.getpgid(p.pid), signal.SIGTERM)
@@ -155,14 +194,15 @@ def terminate_all_procs(timeout: float = 3.0) -> None:
 
     # 2) Wait a bit
     deadline = time.time() + max(0.1, timeout)
-    for p in procs:
-        try:
-            if p.poll() is None:
-                remaining = deadline - time.time()
-                if remaining > 0:
-                    p.wait(remaining)
-        except Exception:
-            pass
+    if not _wait_pidfds(procs, deadline):
+        for p in procs:
+            try:
+                if p.poll() is None:
+                    remaining = deadline - time.time()
+                    if remaining > 0:
+                        p.wait(remaining)
+            except Exception:
+                pass
 
     # 3) Hard kill leftovers
     for p in procs:
@@ -176,46 +216,101 @@ def terminate_all_procs(timeout: float = 3.0) -> None:
             pass
 
     # Cleanup registry
-    for p in procs:
-        _unregister_proc(p)
+    _CURRENT_PROCS.difference_update(procs)
+
+
+# Shared worker threads for fanning out ffmpeg/ffprobe children (created lazily,
+# reused across runs instead of building an executor per call).
+_WORKER_POOL: ThreadPoolExecutor | None = None
+
+
+def _worker_pool() -> ThreadPoolExecutor:
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        _WORKER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="wb")
+    return _WORKER_POOL
 
 
 def _last_lines(s: str, n: int = 12) -> str:
+    # Split only a tail window (grown as needed), not a possibly huge stderr;
+    # once the window holds more than n lines its cut-off first line is unused.
     try:
-        return "\n".join(s.splitlines()[-n:])
+        w = 4096
+        while True:
+            lines = s[-w:].splitlines()
+            if len(lines) > n or w >= len(s):
+                return "\n".join(lines[-n:])
+            w *= 4
     except Exception:
         return s
 
 
+# How much trailing stderr a tail_only run decodes
+_TAIL_BYTES = 64 * 1024
+
+
+# Console-less children on Windows: skips per-process console host setup
+_CREATE_NO_WINDOW = 0x08000000
+
+
 def _run_capture(
-    cmd: list[str], *, timeout: float | None = None, check: bool = True, cwd: str | None = None
+    cmd: list[str],
+    *,
+    timeout: float | None = None,
+    check: bool = True,
+    cwd: str | Path | None = None,
+    env: dict[str, str] | None = None,
+    text: bool = True,
+    tail_only: bool = False,
+    input: bytes | str | None = None,
 ) -> tuple[int, str, str]:
     """
     Run a command to completion, capturing stdout/stderr with optional timeout.
     Raises CalledProcessError when check=True and rc != 0 (with stderr tail).
+    With tail_only=True stdout is discarded and only the last _TAIL_BYTES of
+    stderr are decoded (out is returned as ""). input, if given, is written to
+    the child's stdin (bytes in tail_only mode).
     """
-    p = _spawn_process(cmd, cwd=cwd)
+    # stdin is a pipe only when input is given, DEVNULL otherwise; with fewer pipes
+    # communicate() can read a lone stderr directly instead of multiplexing.
+    stdin = subprocess.DEVNULL if input is None else subprocess.PIPE
+    kwargs: dict = {"cwd": cwd, "env": env, "stdin": stdin, "text": text}
+    if tail_only:
+        kwargs.update(stdout=subprocess.DEVNULL, text=False)
+    if os.name == "nt":
+        kwargs["creationflags"] = _CREATE_NO_WINDOW
+    p = _spawn_process(cmd, **kwargs)
     try:
-        out, err = p.communicate(timeout=timeout)
-    except subprocess.TimeoutExpired:
-        # escalate on timeout
-        try:
-            if os.name == "nt":
-                p.send_signal(signal.CTRL_BREAK_EVENT)
-            else:
-                os.killpg(os.getpgid(p.pid), signal.SIGTERM)
-        except Exception:
-            pass
-        finally:
+        with p:
             try:
-                out, err = p.communicate(timeout=1.0)
-            except Exception:
-                out, err = "", ""
-        rc = p.poll() if p.poll() is not None else -9
-    else:
-        rc = p.returncode
+                out, err = p.communicate(input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # escalate on timeout
+                try:
+                    if os.name == "nt":
+                        if p in _NO_CONSOLE_PROCS:
+                            p.terminate()
+                        else:
+                            p.send_signal(signal.CTRL_BREAK_EVENT)
+                    else:
+                        os.killpg(os.getpgid(p.pid), signal.SIGTERM)
+                except Exception:
+                    pass
+                try:
+                    out, err = p.communicate(timeout=1.0)
+                except Exception:
+                    out, err = None, None
+                    p.kill()  # don't let the context manager wait forever
+                rc = p.poll() if p.poll() is not None else -9
+            else:
+                rc = p.returncode
     finally:
-        _unregister_proc(p)
+        _CURRENT_PROCS.discard(p)
+
+    if tail_only:
+        out, err = "", (err or b"")[-_TAIL_BYTES:].decode("utf-8", errors="replace")
+    else:
+        out, err = out or "", err or ""
 
     if check and rc != 0:
         tail = _last_lines(err)
@@ -224,13 +319,20 @@ def _run_capture(
 
 
 def run_quiet(
-    cmd: list[str], *, timeout: float | None = None, cwd: str | None = None
+    cmd: list[str],
+    *,
+    timeout: float | None = None,
+    cwd: str | None = None,
+    input: bytes | None = None,
 ) -> tuple[int, str]:
     """
     Run and return (rc, stderr_tail). Keeps last lines of stderr for diagnostics.
+    input, if given, is fed to the child's stdin.
     """
     try:
-        rc, _, err = _run_capture(cmd, timeout=timeout, check=False, cwd=cwd)
+        rc, _, err = _run_capture(
+            cmd, timeout=timeout, check=False, cwd=cwd, tail_only=True, input=input
+        )
     except subprocess.CalledProcessError as e:
         # shouldn't happen because check=False above, but just in case
         return e.returncode, _last_lines(e.stderr or "")
@@ -249,7 +351,7 @@ def run_capture(
     text: bool = True,
 ) -> str:
     """Convenience wrapper returning stdout (raises on non-zero)."""
-    rc, out, err = _run_capture(cmd, cwd=cwd, env=env, text=text)
+    rc, out, err = _run_capture(cmd, check=False, cwd=cwd, env=env, text=text)
     if rc != 0:
         raise RuntimeError(f"{cmd[0]} exited with {rc}: {(err or out).strip()}")
     return out
@@ -260,57 +362,68 @@ def run_capture(
 # -----------------------
 
 
+# Install locations probed when a tool is not on PATH, computed once at import.
+if os.name == "nt":
+    _LOCALAPPDATA = os.environ.get("LOCALAPPDATA", "")
+    _USERPROFILE = os.environ.get("USERPROFILE", "")
+    _PROGRAM_FILES = os.environ.get("ProgramFiles", "")
+    _PROGRAM_FILES_X86 = os.environ.get("ProgramFiles(x86)", "")
+    _PROGRAM_DATA = os.environ.get("ProgramData", "C:\\ProgramData")
+    # WinGet, Chocolatey and Scoop shims apply to every tool
+    _TOOL_DIRS: tuple[str, ...] = tuple(
+        d
+        for d in (
+            _LOCALAPPDATA and os.path.join(_LOCALAPPDATA, "Microsoft", "WinGet", "Links"),
+            os.path.join(_PROGRAM_DATA, "chocolatey", "bin"),
+            _USERPROFILE and os.path.join(_USERPROFILE, "scoop", "shims"),
+        )
+        if d
+    )
+    _FFMPEG_DIRS = tuple(
+        os.path.join(base, "FFmpeg", "bin") for base in (_PROGRAM_FILES, _PROGRAM_FILES_X86) if base
+    )
+    # App-specific installs, keyed by lowercased tool name
+    _TOOL_EXTRA_DIRS: dict[str, tuple[str, ...]] = {
+        "mp3gain": tuple(
+            os.path.join(base, "MP3Gain") for base in (_PROGRAM_FILES_X86, _PROGRAM_FILES) if base
+        ),
+        "ffmpeg": _FFMPEG_DIRS,
+        "ffprobe": _FFMPEG_DIRS,
+    }
+    _TOOL_SUFFIX = ".exe"
+else:
+    # macOS/Homebrew first, then the usual Linux/Unix locations
+    _TOOL_DIRS = (
+        ("/opt/homebrew/bin", "/usr/local/bin", "/usr/bin")
+        if sys.platform == "darwin"
+        else ("/usr/bin", "/usr/local/bin")
+    )
+    _TOOL_EXTRA_DIRS = {}
+    _TOOL_SUFFIX = ""
+
+
 def resolve_tool_path(exe: str) -> str | None:
-    """Best-effort cross-platform lookup for external tools."""
+    """Best-effort cross-platform lookup for external tools (cached per name)."""
+    return _resolve_tool_path_cached(exe)
+
+
+def clear_tool_cache() -> None:
+    """Forget cached tool lookups, e.g. after installing dependencies."""
+    _resolve_tool_path_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_tool_path_cached(exe: str) -> str | None:
     # 1) PATH
     p = shutil.which(exe)
     if p:
         return p
-    # 2) Windows common locations
-    if os.name == "nt":
-        candidates = []
-        local = os.environ.get("LOCALAPPDATA", "")
-        userprofile = os.environ.get("USERPROFILE", "")
-        program_files = os.environ.get("ProgramFiles", "")
-        program_files_x86 = os.environ.get("ProgramFiles(x86)", "")
-        # WinGet shim
-        if local:
-            candidates.append(os.path.join(local, "Microsoft", "WinGet", "Links", f"{exe}.exe"))
-        # Chocolatey shims
-        candidates.append(
-            os.path.join(
-                os.environ.get("ProgramData", "C:\\ProgramData"),
-                "chocolatey",
-                "bin",
-                f"{exe}.exe",
-            )
-        )
-        # Scoop shims
-        if userprofile:
-            candidates.append(os.path.join(userprofile, "scoop", "shims", f"{exe}.exe"))
-        # App-specific installs
-        if exe.lower() == "mp3gain":
-            if program_files_x86:
-                candidates.append(os.path.join(program_files_x86, "MP3Gain", "mp3gain.exe"))
-            if program_files:
-                candidates.append(os.path.join(program_files, "MP3Gain", "mp3gain.exe"))
-        # ffmpeg/ffprobe common dir
-        for base in [program_files, program_files_x86]:
-            if base:
-                candidates.append(os.path.join(base, "FFmpeg", "bin", f"{exe}.exe"))
-        for c in candidates:
-            if c and os.path.exists(c):
-                return c
-    # 3) macOS/Homebrew typical
-    if sys.platform == "darwin":
-        for pth in ["/opt/homebrew/bin", "/usr/local/bin"]:
-            cand = os.path.join(pth, exe)
-            if os.path.exists(cand):
-                return cand
-    # 4) Linux common
-    for pth in ["/usr/bin", "/usr/local/bin"]:
-        cand = os.path.join(pth, exe)
-        if os.path.exists(cand):
+    # 2) Common install locations for this platform/tool: one stat per candidate
+    # (bin dirs can hold thousands of entries, so listing them would cost more)
+    name = exe + _TOOL_SUFFIX
+    for d in _TOOL_DIRS + _TOOL_EXTRA_DIRS.get(exe.lower(), ()):
+        cand = os.path.join(d, name)
+        if os.path.isfile(cand):
             return cand
     return None
 
@@ -324,7 +437,22 @@ def have(exe: str) -> bool:
 # -----------------------
 
 
+def _mp3_duration_fast(path: Path) -> float | None:
+    """Duration from the MP3 frame headers (Xing/Info when present), no subprocess."""
+    try:
+        from mutagen.mp3 import MP3
+
+        length = float(MP3(str(path)).info.length)
+    except Exception:
+        return None
+    return length if 0 < length < float("inf") else None
+
+
 def _ffprobe_duration_seconds(path: Path, log) -> float:
+    if path.suffix.lower() == ".mp3":
+        d = _mp3_duration_fast(path)
+        if d is not None:
+            return d
     try:
         out = run_capture(
             [
@@ -420,6 +548,7 @@ def check_and_install_deps(log: Callable[[str], None] | None = None) -> None:
                 log(f"Successfully ran install command for {c[4]}.")
             except Exception as e:
                 log(f"Install step failed: {e}")
+        clear_tool_cache()
         log("If tools are still not detected, you may need to restart your shell/terminal.")
 
     # Write helper scripts for manual installation.
@@ -456,38 +585,20 @@ def write_playlist(outdir: Path, files: list[Path], log, name: str, fmt: str) ->
     try:
         # Collect metadata for EXTINF
         meta = []
-        try:
-            from mutagen.id3 import ID3
-
-            have_tags = True
-        except Exception:
-            have_tags = False
+        part_meta = _collect_part_meta(files, log)
         for f in files:
-            dur = int(round(_ffprobe_duration_seconds(f, log)))
-            title = f.stem
-            artist = ""
-            if have_tags:
-                try:
-                    tags = ID3(f)
-                    if tags.get("TIT2"):
-                        title = str(tags["TIT2"].text[0])
-                    if tags.get("TPE1"):
-                        artist = str(tags["TPE1"].text[0])
-                except Exception:
-                    pass
+            title, artist, dur = part_meta[f]
             disp = (
                 f"{artist + ' - ' if artist else ''}{title}".replace("\n", " ").lstrip("#").strip()
             )
-            meta.append((f.name, dur, disp))
+            meta.append((f.name, int(round(dur)), disp))
 
         if fmtU in ("M3U8", "BOTH"):
             pl = outdir / f"{name}.m3u8"
-            lines = ["#EXTM3U"]
-            for fname, dur, disp in meta:
-                lines.append(f"#EXTINF:{dur},{disp}")
-                lines.append(fname)
-            txt = "\n".join(lines) + "\n"
-            pl.write_text(txt, encoding="utf-8")
+            with pl.open("w", encoding="utf-8") as fh:
+                fh.write("#EXTM3U\n")
+                for fname, dur, disp in meta:
+                    fh.write(f"#EXTINF:{dur},{disp}\n{fname}\n")
             log(f"Wrote playlist: {pl.name}")
         if fmtU in ("M3U", "BOTH"):
             pl2 = outdir / f"{name}.m3u"
@@ -503,23 +614,13 @@ def write_playlist(outdir: Path, files: list[Path], log, name: str, fmt: str) ->
 
 def write_cue_for_joined(joined_mp3: Path, parts: list[Path], log) -> None:
     try:
-        from mutagen.id3 import ID3
+        import mutagen.id3  # noqa: F401
     except Exception as e:
         log(f"mutagen not available for CUE metadata: {e}")
         return
     try:
-        meta: list[tuple[str, str, float]] = []
-        for p in parts:
-            title, artist = p.stem, ""
-            try:
-                tags = ID3(p)
-                if tags.get("TIT2"):
-                    title = str(tags["TIT2"].text[0])
-                if tags.get("TPE1"):
-                    artist = str(tags["TPE1"].text[0])
-            except Exception:
-                pass
-            meta.append((title, artist, _ffprobe_duration_seconds(p, log)))
+        part_meta = _collect_part_meta(parts, log)
+        meta = [part_meta[p] for p in parts]
         cue = joined_mp3.with_suffix(".cue")
         lines = []
         lines.append(f'TITLE "{joined_mp3.stem}"')
@@ -529,10 +630,9 @@ def write_cue_for_joined(joined_mp3: Path, parts: list[Path], log) -> None:
         fps = 75
         t = 0.0
         for i, (title, artist, dur) in enumerate(meta, start=1):
-            frames = int(round(t * fps))
-            mm = frames // (60 * fps)
-            ss = (frames // fps) % 60
-            ff = frames % fps
+            # Round the running start, not each duration, so errors don't add up
+            mm, rem = divmod(int(round(t * fps)), 60 * fps)
+            ss, ff = divmod(rem, fps)
             lines.append(f"  TRACK {i:02d} AUDIO")
             if artist:
                 lines.append(f'    PERFORMER "{artist}"')
@@ -559,38 +659,31 @@ def embed_id3_chapters(joined_mp3: Path, parts: list[Path], log) -> None:
             tags = ID3()
 
         def _attach(frame, sub):
-            if hasattr(frame, "add"):
-                try:
-                    frame.add(sub)
-                    return
-                except Exception:
-                    pass
+            # CHAP/CTOC keep their embedded frames in an ID3Tags at .sub_frames
             try:
-                frame.subframes[sub.HashKey] = [sub]
+                frame.sub_frames.add(sub)
             except Exception:
                 pass
 
+        # Phase 1: all tag/duration I/O (cached, probed in parallel) and the
+        # chapter boundaries, from the running total so rounding never adds up
+        part_meta = _collect_part_meta(parts, log)
+        rows = [part_meta[p] for p in parts]
+        ends = [int(round(t * 1000)) for t in itertools.accumulate(dur for _, _, dur in rows)]
+
+        # Phase 2: build the frames
         ids = []
         start_ms = 0
-        for idx, p in enumerate(parts, start=1):
-            dur = _ffprobe_duration_seconds(p, log)
-            end_ms = int(round((start_ms / 1000.0 + dur) * 1000))
+        for idx, ((t_title, t_artist, _dur), end_ms) in enumerate(
+            zip(rows, ends, strict=True), start=1
+        ):
             chap = CHAP(
-                element_id=f"chp{idx}".encode("ascii"),
+                element_id=f"chp{idx}",
                 start_time=start_ms,
                 end_time=end_ms,
                 start_offset=0,
                 end_offset=0,
             )
-            t_title, t_artist = p.stem, ""
-            try:
-                src = ID3(p)
-                if src.get("TIT2"):
-                    t_title = str(src["TIT2"].text[0])
-                if src.get("TPE1"):
-                    t_artist = str(src["TPE1"].text[0])
-            except Exception:
-                pass
             _attach(chap, TIT2(encoding=3, text=t_title))
             if t_artist:
                 _attach(chap, TPE1(encoding=3, text=t_artist))
@@ -598,7 +691,7 @@ def embed_id3_chapters(joined_mp3: Path, parts: list[Path], log) -> None:
             ids.append(chap.element_id)
             start_ms = end_ms
 
-        toc = CTOC(element_id=b"toc", flags=0x03, child_element_ids=ids)
+        toc = CTOC(element_id="toc", flags=0x03, child_element_ids=ids)
         _attach(toc, TIT2(encoding=3, text=joined_mp3.stem))
         tags.add(toc)
         tags.save(joined_mp3, v2_version=3)
@@ -612,39 +705,25 @@ def write_vlc_segment_playlist(joined_mp3: Path, parts: list[Path], outdir: Path
     Create a VLC-specific M3U that emulates chapters by repeating the same MP3
     with #EXTVLCOPT:start-time / stop-time per segment.
     """
-    try:
-        from mutagen.id3 import ID3
-
-        have_tags = True
-    except Exception:
-        have_tags = False
-
-    lines = ["#EXTM3U"]
-    start = 0.0
-    for p in parts:
-        dur = _ffprobe_duration_seconds(p, log)
-        end = start + max(dur, 0.1)
-        title = p.stem
-        artist = ""
-        if have_tags:
-            try:
-                tags = ID3(p)
-                if tags.get("TIT2"):
-                    title = str(tags["TIT2"].text[0])
-                if tags.get("TPE1"):
-                    artist = str(tags["TPE1"].text[0])
-            except Exception:
-                pass
-        disp = f"{artist + ' - ' if artist else ''}{title}".replace("\n", " ").lstrip("#").strip()
-        secs = max(1, int(round(end - start)))
-        lines.append(f"#EXTINF:{secs},{disp}")
-        lines.append(f"#EXTVLCOPT:start-time={int(round(start))}")
-        lines.append(f"#EXTVLCOPT:stop-time={int(round(end))}")
-        lines.append(joined_mp3.name)
-        start = end
-
+    part_meta = _collect_part_meta(parts, log)
     out = outdir / f"{joined_mp3.stem}.vlc-segments.m3u"
-    out.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    start = 0.0
+    with out.open("w", encoding="utf-8") as fh:
+        fh.write("#EXTM3U\n")
+        for p in parts:
+            title, artist, dur = part_meta[p]
+            end = start + max(dur, 0.1)
+            disp = (
+                f"{artist + ' - ' if artist else ''}{title}".replace("\n", " ").lstrip("#").strip()
+            )
+            secs = max(1, int(round(end - start)))
+            fh.write(
+                f"#EXTINF:{secs},{disp}\n"
+                f"#EXTVLCOPT:start-time={int(round(start))}\n"
+                f"#EXTVLCOPT:stop-time={int(round(end))}\n"
+                f"{joined_mp3.name}\n"
+            )
+            start = end
     log(f"Wrote VLC segment playlist: {out.name}")
 
 
@@ -687,10 +766,23 @@ def prepare_cookies(
 # In workbench_core.py
 
 
+# Characters that would break a tab-separated cookies.txt row
+_COOKIE_FIELD_ESCAPES = str.maketrans({"\t": "%09", "\n": "%0A", "\r": "%0D"})
+
+
+def _load_cookie_json(path: Path):
+    raw = path.read_bytes()
+    try:
+        return json_loads(raw)
+    except ValueError:
+        pass  # e.g. stray invalid UTF-8; the lenient path below copes
+    return json.loads(raw.decode("utf-8", errors="ignore"))
+
+
 def convert_cookie_editor_json_to_netscape(json_path: Path, out_txt: Path, log) -> Path:
     """Convert Cookie-Editor/EditThisCookie JSON into a Netscape cookies.txt with header."""
     try:
-        data = json.loads(json_path.read_text(encoding="utf-8", errors="ignore"))
+        data = _load_cookie_json(json_path)
         if isinstance(data, dict) and "cookies" in data:
             data = data["cookies"]
         lines = []
@@ -715,17 +807,10 @@ def convert_cookie_editor_json_to_netscape(json_path: Path, out_txt: Path, log)
                 exp = int(float(exp))
             except Exception:
                 exp = 0
-            name = (
-                (c.get("name") or "").replace("\t", "%09").replace("\n", "%0A").replace("\r", "%0D")
-            )
-            value = (
-                (c.get("value") or "")
-                .replace("\t", "%09")
-                .replace("\n", "%0A")
-                .replace("\r", "%0D")
-            )
+            name = (c.get("name") or "").translate(_COOKIE_FIELD_ESCAPES)
+            value = (c.get("value") or "").translate(_COOKIE_FIELD_ESCAPES)
             domain_field = ("#HttpOnly_" + domain) if c.get("httpOnly") else domain
-            lines.append("\t".join([domain_field, include_sub, path, https, str(exp), name, value]))
+            lines.append(f"{domain_field}\t{include_sub}\t{path}\t{https}\t{exp}\t{name}\t{value}")
         out_txt.write_text(header + "\n".join(lines) + "\n", encoding="utf-8")
 
         # vvv FIX IS HERE vvv
@@ -776,24 +861,45 @@ def validate_netscape_cookiefile(path: Path, log) -> tuple[bool, str]:
 # -----------------------
 
 
+_DEDUP_ARTIST_PAT = re.compile(
+    r"^(?:(?P<num>\d+)\s*-\s*)?(?P<a>[^-]+?)\s-\s(?P=a)\s-\s(?P<rest>.+)$",
+    re.IGNORECASE,
+)
+
+
+# Fold names for collision checks only where the filesystem ignores case
+_FS_CASE_INSENSITIVE = os.name == "nt" or sys.platform == "darwin"
+
+
+def _fs_name_key(name: str) -> str:
+    return name.casefold() if _FS_CASE_INSENSITIVE else name
+
+
 def _dedup_artist_in_filenames(files, log):
     """Rename files where filename pattern repeats the artist, e.g.:
     'Artist - Artist - Title.mp3' or '001 - Artist - Artist - Title.mp3' -> single artist once.
     """
     out = []
-    pat = re.compile(
-        r"^(?:(?P<num>\d+)\s*-\s*)?(?P<a>[^-]+?)\s-\s(?P=a)\s-\s(?P<rest>.+)$",
-        re.IGNORECASE,
-    )
+    # One scandir per folder that has a match replaces an exists() stat per
+    # rename. Names are casefolded on case-insensitive filesystems so a file
+    # never gets replaced by a case-only twin.
+    taken: dict[Path, set[str]] = {}
     for p in files:
         try:
-            m = pat.match(p.stem)
+            m = _DEDUP_ARTIST_PAT.match(p.stem)
             if m:
                 prefix = (m.group("num") + " - ") if m.group("num") else ""
                 new_stem = f"{prefix}{m.group('a').strip()} - {m.group('rest').strip()}"
-                new_path = p.with_name(new_stem + p.suffix)
-                if not new_path.exists():
+                new_name = new_stem + p.suffix
+                names = taken.get(p.parent)
+                if names is None:
+                    with os.scandir(p.parent) as it:
+                        names = taken[p.parent] = {_fs_name_key(e.name) for e in it}
+                if _fs_name_key(new_name) not in names:
+                    new_path = p.with_name(new_name)
                     os.replace(p, new_path)
+                    names.discard(_fs_name_key(p.name))
+                    names.add(_fs_name_key(new_name))
                     log(f"Renamed (dedup artist): {p.name} -> {new_path.name}")
                     out.append(new_path)
                     continue
@@ -803,6 +909,208 @@ def _dedup_artist_in_filenames(files, log):
     return out
 
 
+# Per-file results keyed by (resolved path, mtime_ns, size); the playlist, CUE,
+# chapter and VLC writers all ask about the same parts during one run.
+_FileKey = tuple[Path, int, int]
+_DURATION_CACHE: dict[_FileKey, float] = {}
+_TAG_CACHE: dict[_FileKey, tuple[str, str]] = {}
+# The caches live for the whole session and every rewrite of a file adds a new
+# key, so each keeps only this many most recently used entries.
+_FILE_CACHE_MAX = 2048
+
+
+def _cache_get(cache: dict, key):
+    """LRU lookup: a hit moves the entry to the most recently used end."""
+    value = cache.pop(key, None)
+    if value is not None:
+        cache[key] = value
+    return value
+
+
+def _cache_put(cache: dict, key, value) -> None:
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > _FILE_CACHE_MAX:
+        del cache[next(iter(cache))]  # least recently used
+
+
+def _file_key(p: Path) -> _FileKey | None:
+    try:
+        st = p.stat()
+        return (p.resolve(), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _ffprobe_durations(paths: list[Path], log) -> dict[Path, float]:
+    """Durations for all paths, probing uncached ones concurrently on the worker pool."""
+    keys = {p: _file_key(p) for p in paths}
+    # Take cache hits up front; storing new probes may evict entries
+    out: dict[Path, float] = {}
+    for p, k in keys.items():
+        d = _cache_get(_DURATION_CACHE, k) if k is not None else None
+        if d is not None:
+            out[p] = d
+    todo = [p for p in keys if p not in out]
+    durations = _worker_pool().map(lambda p: _ffprobe_duration_seconds(p, log), todo)
+    for p, d in zip(todo, durations, strict=True):
+        out[p] = d
+        k = keys[p]
+        if k is not None and d > 0:  # don't pin failed probes
+            _cache_put(_DURATION_CACHE, k, d)
+    return out
+
+
+def _collect_part_meta(parts: list[Path], log) -> dict[Path, tuple[str, str, float]]:
+    """{path: (title, artist, duration)}; ID3 is parsed once per file version.
+    Title falls back to the stem and artist to "" when tags are missing."""
+    try:
+        from mutagen.id3 import ID3
+    except Exception:
+        ID3 = None
+    durations = _ffprobe_durations(parts, log)
+    out: dict[Path, tuple[str, str, float]] = {}
+    for p in parts:
+        key = _file_key(p)
+        tags = _cache_get(_TAG_CACHE, key) if key else None
+        if tags is None:
+            title, artist = p.stem, ""
+            if ID3 is not None:
+                try:
+                    id3 = ID3(p)
+                    if id3.get("TIT2"):
+                        title = str(id3["TIT2"].text[0])
+                    if id3.get("TPE1"):
+                        artist = str(id3["TPE1"].text[0])
+                except Exception:
+                    pass
+            tags = (title, artist)
+            if key and ID3 is not None:
+                _cache_put(_TAG_CACHE, key, tags)
+        out[p] = (*tags, durations[p])
+    return out
+
+
+def _concat_list_entry(path: Path) -> bytes:
+    # concat demuxer syntax: single-quoted, with ' written as '\''. The path is
+    # emitted in the filesystem encoding so undecodable names still open, and as
+    # an explicit file: URL since the list itself is read from pipe:0.
+    path_b = b"file:" + os.fsencode(path.resolve().as_posix())
+    return b"file '" + path_b.replace(b"'", b"'\\''") + b"'"
+
+
+def _mp3_stream_params(path: Path) -> tuple[int, int, int] | None:
+    """(sample_rate, channels, kbps) of a constant-bitrate MP3 from its headers, else None."""
+    try:
+        from mutagen.mp3 import MP3, BitrateMode
+
+        info = MP3(str(path)).info
+    except Exception:
+        return None
+    if info.bitrate_mode in (BitrateMode.VBR, BitrateMode.ABR):
+        return None
+    return info.sample_rate, info.channels, round(info.bitrate / 1000)
+
+
+def _probe_stream_format(path: Path) -> tuple[str, int, int] | None:
+    """(codec, sample_rate, channels) of the first audio stream, or None if unknown."""
+    if path.suffix.lower() == ".mp3":
+        try:
+            from mutagen.mp3 import MP3
+
+            info = MP3(str(path)).info
+            return f"mp{info.layer}", info.sample_rate, info.channels
+        except Exception:
+            pass
+    try:
+        out = run_capture(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "stream=codec_name,sample_rate,channels",
+                "-of",
+                "default=noprint_wrappers=1",
+                str(path),
+            ]
+        )
+        fields = dict(line.split("=", 1) for line in out.splitlines() if "=" in line)
+        return fields["codec_name"], int(fields["sample_rate"]), int(fields["channels"])
+    except Exception:
+        return None
+
+
+def _can_concat_demux(files: list[Path]) -> bool:
+    # The concat demuxer needs identical stream parameters in every part; a
+    # mismatch can still exit 0 with broken audio, so check before using it.
+    if len({f.suffix.lower() for f in files}) != 1:
+        return False
+    formats = set(_worker_pool().map(_probe_stream_format, files))
+    return len(formats) == 1 and None not in formats
+
+
+def _can_stream_copy(files: list[Path], sr: int, br_kbps: int) -> bool:
+    # Frames can be copied as-is only when every input already is the target format
+    if any(f.suffix.lower() != ".mp3" for f in files):
+        return False
+    params = set(_worker_pool().map(_mp3_stream_params, files))
+    if len(params) != 1:
+        return False
+    (found,) = params
+    return found is not None and found[0] == sr and found[2] == br_kbps
+
+
+# Concat demuxer reading its list from stdin (entries are file: URLs)
+_CONCAT_PIPE_INPUT = (
+    "-f",
+    "concat",
+    "-safe",
+    "0",
+    "-protocol_whitelist",
+    "pipe,file",
+    "-i",
+    "pipe:0",
+)
+
+# The concat filter opens every part at once on one command line; above this many
+# parts it runs per batch so argv (32K chars on Windows) and open fds stay bounded.
+_CONCAT_FILTER_MAX_INPUTS = 64
+
+
+def _concat_filter_cmd(files: list[Path], out_args: list[str]) -> list[str]:
+    inputs = [arg for f in files for arg in ("-i", str(f))]
+    graph = "".join(f"[{i}:a]" for i in range(len(files)))
+    graph += f"concat=n={len(files)}:v=0:a=1[a]"
+    return ["ffmpeg", "-y", *inputs, "-filter_complex", graph, "-map", "[a]", *out_args]
+
+
+def _concat_filter_join(files: list[Path], sr: int, encode: list[str]) -> tuple[int, str]:
+    """Join mixed-format parts with the concat filter, batching large inputs."""
+    if len(files) <= _CONCAT_FILTER_MAX_INPUTS:
+        return run_quiet(_concat_filter_cmd(files, encode))
+    n = _CONCAT_FILTER_MAX_INPUTS
+    batches = [files[i : i + n] for i in range(0, len(files), n)]
+    with tempfile.TemporaryDirectory(prefix="wb_join_") as tmp:
+        wavs = [Path(tmp) / f"batch{i:04d}.wav" for i in range(len(batches))]
+        # Fixed PCM parameters so the batch WAVs can be concat-demuxed losslessly
+        pcm = ["-ar", str(sr), "-ac", "2", "-codec:a", "pcm_s16le"]
+        # Wait for every batch before the temp dir goes away, even if one failed
+        results = list(
+            _worker_pool().map(
+                lambda bw: run_quiet(_concat_filter_cmd(bw[0], [*pcm, str(bw[1])])),
+                zip(batches, wavs, strict=True),
+            )
+        )
+        for rc, err in results:
+            if rc != 0:
+                return rc, err
+        concat_list = b"\n".join(_concat_list_entry(w) for w in wavs) + b"\n"
+        return run_quiet(["ffmpeg", "-y", *_CONCAT_PIPE_INPUT, *encode], input=concat_list)
+
+
 def join_via_wav_then_lame(
     files: list[Path],
     outdir: Path,
@@ -814,101 +1122,76 @@ def join_via_wav_then_lame(
     keep_temp: bool = False,
     progress=None,
 ) -> Path:
+    """
+    Join files into one MP3 with a single ffmpeg run (concat, plus decode/resample/encode).
+    Inputs with identical stream parameters go through the concat demuxer, with
+    frames copied instead of re-encoded when they are CBR MP3s already at sr/br_kbps;
+    mixed formats, or a demuxer failure, use the concat filter. No intermediate
+    files are written: the concat list is fed to ffmpeg on stdin.
+    keep_temp is deprecated and ignored (there are no temp WAVs to keep).
+    """
     if shuffle:
         random.shuffle(files)
         log("Join order randomized.")
-    tmp_wavs: list[Path] = []
-    try:
-        total_steps = max(1, len(files) + 2)
-        step = 0
-        for idx, f in enumerate(files):
+    if not files:
+        raise RuntimeError("Nothing to join")
+    joined = outdir / f"{join_name or 'joined'}.mp3"
+    encode = ["-ar", str(sr), "-codec:a", "libmp3lame", "-b:a", f"{br_kbps}k", str(joined)]
+    rc, err = 1, ""
+    if _can_concat_demux(files):
+        if callable(progress):
+            progress(0, "Joining: preparing concat list...")
+        concat_list = b"\n".join(_concat_list_entry(f) for f in files) + b"\n"
+        demux = ["ffmpeg", "-y", *_CONCAT_PIPE_INPUT]
+        if _can_stream_copy(files, sr, br_kbps):
             if callable(progress):
-                pct = int(((step) / total_steps) * 100)
-                progress(pct, f"Joining: decoding {idx + 1}/{len(files)}...")
-            wav = outdir / f"._tmp_{f.stem}.wav"
-            cmd = ["ffmpeg", "-y", "-i", str(f), "-ar", str(sr), str(wav)]
-            rc = run_quiet(cmd)
+                progress(10, "Joining: concatenating (no re-encode)...")
+            rc, err = run_quiet([*demux, "-c", "copy", str(joined)], input=concat_list)
             if rc != 0:
-                raise RuntimeError(f"WAV transcode failed for {f.name}")
-            tmp_wavs.append(wav)
-            step += 1
-        if callable(progress):
-            pct = int(((step) / total_steps) * 100)
-            progress(pct, "Joining: preparing concat list...")
-        listfile = outdir / "._concat_list.txt"
-        listfile.write_text("\n".join(f"file '{w.name}'" for w in tmp_wavs), encoding="utf-8")
-        if callable(progress):
-            progress(int(((step) / total_steps) * 100), "Joining: concatenating...")
-        concat_wav = outdir / "._concat.wav"
-        rc = run_quiet(
-            [
-                "ffmpeg",
-                "-y",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                str(listfile),
-                str(concat_wav),
-            ]
-        )
+                log("Stream copy failed; re-encoding instead.")
         if rc != 0:
-            raise RuntimeError("WAV concat failed")
-        joined = outdir / f"{join_name or 'joined'}.mp3"
-        rc = run_quiet(
+            if callable(progress):
+                progress(10, "Joining: concatenating and encoding...")
+            rc, err = run_quiet([*demux, *encode], input=concat_list)
+            if rc != 0:
+                log("Concat demuxer failed; retrying with the concat filter.")
+    if rc != 0:
+        if callable(progress):
+            progress(10, "Joining: concatenating and encoding...")
+        rc, err = _concat_filter_join(files, sr, encode)
+    if rc != 0:
+        raise RuntimeError(f"Join failed: {err}" if err else "Join failed")
+    if callable(progress):
+        progress(100, "Joining: done.")
+    return joined
+
+
+def _probe_sample_rate(path: Path) -> int:
+    try:
+        out = run_capture(
             [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(concat_wav),
-                "-codec:a",
-                "libmp3lame",
-                "-b:a",
-                f"{br_kbps}k",
-                str(joined),
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "stream=sample_rate",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(path),
             ]
         )
-        if rc != 0:
-            raise RuntimeError("LAME encode failed")
-        return joined
-    finally:
-        if not keep_temp:
-            for p in tmp_wavs:
-                try:
-                    p.unlink()
-                except Exception:
-                    pass
-            for p in (outdir / "._concat.wav", outdir / "._concat_list.txt"):
-                try:
-                    p.unlink()
-                except Exception:
-                    pass
+        return int(str(out).strip() or 0)
+    except Exception:
+        return 0
 
 
 def validate_sample_rates(files: list[Path], expected_sr: int, log) -> None:
-    mismatches = []
-    for f in files:
-        try:
-            out = run_capture(
-                [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-select_streams",
-                    "a:0",
-                    "-show_entries",
-                    "stream=sample_rate",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1",
-                    str(f),
-                ]
-            )
-            sr = int(str(out).strip() or 0)
-            if sr and sr != expected_sr:
-                mismatches.append((f.name, sr))
-        except Exception:
-            pass
+    rates = _worker_pool().map(_probe_sample_rate, files)
+    mismatches = [
+        (f.name, sr) for f, sr in zip(files, rates, strict=True) if sr and sr != expected_sr
+    ]
     if mismatches:
         log("Validation warnings (sample_rate mismatch):")
         for name, sr in mismatches:
@@ -920,22 +1203,23 @@ def validate_sample_rates(files: list[Path], expected_sr: int, log) -> None:
 # -----------------------
 
 
+# One C-level pass drops control chars and turns filesystem reserved, shell
+# special and playlist/software-quirk chars into hyphens
+_SANITIZE_TABLE = str.maketrans(
+    {**{c: "-" for c in '<>:"/\\|?*&;$\'()![]{}#%,'}, **dict.fromkeys([*range(32), 0x7F])}
+)
+_RE_SEPARATOR_RUNS = re.compile(r"[-\s]{2,}")
+
+
 def _sanitize_filename_component(name: str) -> str:
     """
     Replace characters that commonly break on Windows/shells/old players.
     Keeps readability; collapses runs of separators; trims trailing dots/spaces.
     """
-    import re
-
-    # Remove control chars
-    name = "".join(ch for ch in name if ch >= " " and ch != "\x7f")
-    # Replace reserved / risky chars with hyphen
-    name = re.sub(r'[<>:"/\\|?*]', "-", name)  # filesystem reserved
-    name = re.sub(r"[&;$'\"()!]", "-", name)  # shell specials
-    name = re.sub(r"[\[\]{}#%,]", "-", name)  # playlist/software quirks
+    name = name.translate(_SANITIZE_TABLE)
     # Collapse whitespace and hyphens
-    name = re.sub(r"\s+", " ", name)
-    name = re.sub(r"[-\s]{2,}", " ", name)
+    name = " ".join(name.split())
+    name = _RE_SEPARATOR_RUNS.sub(" ", name)
     # Strip dangerous trailing chars
     name = name.strip(" .-_")
     # Guard empty
@@ -943,39 +1227,69 @@ def _sanitize_filename_component(name: str) -> str:
 
 
 def _sanitize_and_rename(files: list[Path], log) -> list[Path]:
-    out = []
     seen = set()
+    # Collision checks go against one scandir snapshot per folder (kept current
+    # as we plan, casefolded where the filesystem ignores case) instead of an
+    # exists() stat per probe.
+    taken: dict[Path, set[str]] = {}
+
+    def names_in(parent: Path) -> set[str]:
+        names = taken.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as it:
+                    names = {_fs_name_key(e.name) for e in it}
+            except OSError:
+                names = set()
+            taken[parent] = names
+        return names
+
+    # 1) Pick every destination up front. Source names stay reserved, so no
+    # destination is a file that another rename has yet to move away.
+    plan: list[tuple[Path, Path, bool]] = []
     for p in files:
         stem = p.stem
         san = _sanitize_filename_component(stem)
         cand = p.with_name(san + p.suffix)
+        names = names_in(p.parent)
         # Avoid collisions
         i = 1
-        while cand.exists() and cand != p:
+        while _fs_name_key(cand.name) in names and cand != p:
             cand = p.with_name(f"{san}_{i}{p.suffix}")
             i += 1
-        if cand != p:
-            try:
-                p.rename(cand)
-                log(f"Renamed (sanitized): {p.name} -> {cand.name}")
-            except Exception as e:
-                log(f"Sanitize/rename failed for {p.name}: {e}")
-                cand = p
         # Track unique
-        if cand.name in seen:
+        dup = cand.name in seen
+        if dup:
             # append numeric to avoid duplicates within run
             j = 1
             alt = cand.with_name(f"{cand.stem}_{j}{cand.suffix}")
-            while alt.exists():
+            while _fs_name_key(alt.name) in names:
                 j += 1
                 alt = cand.with_name(f"{cand.stem}_{j}{cand.suffix}")
-            try:
-                cand.rename(alt)
-                log(f"Adjusted duplicate: {cand.name} -> {alt.name}")
-                cand = alt
-            except Exception:
-                pass
+            cand = alt
+        names.add(_fs_name_key(cand.name))
         seen.add(cand.name)
+        plan.append((p, cand, dup))
+
+    # 2) The renames are independent now; issue them side by side, log in order
+    def rename(step: tuple[Path, Path, bool]) -> Exception | None:
+        src, dst, _dup = step
+        if dst != src:
+            try:
+                os.rename(src, dst)
+            except Exception as e:
+                return e
+        return None
+
+    out = []
+    for (p, cand, dup), err in zip(plan, _worker_pool().map(rename, plan), strict=True):
+        if err is not None:
+            log(f"Sanitize/rename failed for {p.name}: {err}")
+            cand = p
+        elif dup:
+            log(f"Adjusted duplicate: {p.name} -> {cand.name}")
+        elif cand != p:
+            log(f"Renamed (sanitized): {p.name} -> {cand.name}")
         out.append(cand)
     return out
 
@@ -1000,6 +1314,9 @@ def _parse_artist_title_trackno(path: Path) -> tuple[str | None, str | None, str
     return None, stem, trackno
 
 
+_ID3_MIN_PADDING = 4096
+
+
 def write_id3_tags_mutagen(files: list[Path], album: str | None, log) -> None:
     if not ensure_mutagen_installed(log):
         log("mutagen not installed; skipping ID3 tagging.")
@@ -1007,7 +1324,7 @@ def write_id3_tags_mutagen(files: list[Path], album: str | None, log) -> None:
 
     from mutagen.id3 import ID3, ID3NoHeaderError, TALB, TIT2, TPE1, TRCK
 
-    for p in files:
+    def tag_one(p: Path) -> str:
         try:
             artist, title, trackno = _parse_artist_title_trackno(p)
             try:
@@ -1015,24 +1332,27 @@ def write_id3_tags_mutagen(files: list[Path], album: str | None, log) -> None:
             except ID3NoHeaderError:
                 id3 = ID3()
             if title:
-                id3.delall("TIT2")
-                id3.add(TIT2(encoding=3, text=title))
+                id3.setall("TIT2", [TIT2(encoding=3, text=title)])
             if artist:
-                id3.delall("TPE1")
-                id3.add(TPE1(encoding=3, text=artist))
+                id3.setall("TPE1", [TPE1(encoding=3, text=artist)])
             if album:
-                id3.delall("TALB")
-                id3.add(TALB(encoding=3, text=album))
+                id3.setall("TALB", [TALB(encoding=3, text=album)])
             if trackno:
-                id3.delall("TRCK")
-                id3.add(TRCK(encoding=3, text=str(trackno)))
-            id3.save(p)
-            log(f"Tagged: {p.name}  [{artist or '-'} — {title or p.stem}]  (Album: {album or '-'})")
+                id3.setall("TRCK", [TRCK(encoding=3, text=str(trackno))])
+            # Keep some padding so later tag edits (chapters, retags) fit in place
+            id3.save(p, padding=lambda info: max(info.padding, _ID3_MIN_PADDING))
+            return (
+                f"Tagged: {p.name}  [{artist or '-'} — {title or p.stem}]  (Album: {album or '-'})"
+            )
         except Exception as e:
-            try:
-                log(f"Failed to tag {p.name}: {e}")
-            except Exception:
-                pass
+            return f"Failed to tag {p.name}: {e}"
+
+    # Each file is independent header I/O; tag them side by side, log in order
+    for msg in _worker_pool().map(tag_one, files):
+        try:
+            log(msg)
+        except Exception:
+            pass
 
 
 # -----------------------
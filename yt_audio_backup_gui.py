@@ -56,7 +56,6 @@ import queue
 from pathlib import Path
 
 import tkinter as tk
-from help_window import open_help_window, show_about_dialog, set_app_meta
 
 # Robustly import the local help_window.py to avoid clashes on sys.path
 import importlib.util
@@ -72,10 +71,13 @@ if (
     or not getattr(_hw, "__file__", "")
     or Path(_hw.__file__).resolve() != _HELP_MOD_PATH.resolve()
 ):
-    _spec = importlib.util.spec_from_file_location("awb_help_window", str(_HELP_MOD_PATH))
+    _spec = importlib.util.spec_from_file_location("help_window", str(_HELP_MOD_PATH))
     _mod = importlib.util.module_from_spec(_spec)
     assert _spec and _spec.loader, "Failed to create loader for help_window.py"
     _spec.loader.exec_module(_mod)
+    # Register it under its real name so ui_extras shares this single copy
+    # (one _APP_NAME and one parsed-help cache) instead of importing another.
+    sys.modules["help_window"] = _mod
     open_help_window = _mod.open_help_window
     show_about_dialog = _mod.show_about_dialog
     set_app_meta = _mod.set_app_meta
@@ -369,7 +371,6 @@ class App(tk.Tk):
                         join_name=options.join_name,
                         log=_log,
                         shuffle=options.random_join,
-                        keep_temp=options.keep_temp_wavs,
                         progress=_progress,
                     )
                     if options.write_cue:
@@ -479,7 +480,6 @@ class App(tk.Tk):
         self.verbose_ydl_var = tk.BooleanVar(value=False)
         self.mp3gain_var = tk.BooleanVar(value=True)
         self.hi_integrity_var = tk.BooleanVar(value=False)
-        self.keep_temp_var = tk.BooleanVar(value=False)
         self.dedup_artist_var = tk.BooleanVar(value=False)
         self.sanitize_names_var = tk.BooleanVar(value=True)
         self.validate_sr_var = tk.BooleanVar(value=True)
@@ -835,11 +835,6 @@ class App(tk.Tk):
                 self.random_join_var,
                 "tooltips.checkboxes.randomize_order",
             ),
-            (
-                self._t("checkboxes.keep_temp_wavs", "Keep temp WAVs"),
-                self.keep_temp_var,
-                "tooltips.checkboxes.keep_temp_wavs",
-            ),
         ]
         join_widgets = []
         for label, var, tip_key in join_checks:
@@ -1248,7 +1243,6 @@ class App(tk.Tk):
             embed_chapters=bool(self.embed_chapters_var.get()),
             vlc_segments=bool(self.vlc_segments_var.get()),
             random_join=bool(self.random_join_var.get()),
-            keep_temp_wavs=bool(self.keep_temp_var.get()),
             sleep_between=int(self.sleep_between_var.get()),
             verbose_ydl=bool(self.verbose_ydl_var.get()),
             hi_integrity=bool(self.hi_integrity_var.get()),
@@ -1365,7 +1359,6 @@ class App(tk.Tk):
             self.verbose_ydl_var.set(bool(data.get("verbose_ydl", False)))
             self.mp3gain_var.set(bool(data.get("mp3gain", True)))
             self.hi_integrity_var.set(bool(data.get("hi_integrity", False)))
-            self.keep_temp_var.set(bool(data.get("keep_temp", False)))
             self.playlist_format_var.set(data.get("playlist_format", "M3U8"))
             self.use_run_subdir_var.set(bool(data.get("use_run_subdir", True)))
             self.cookies_file_var.set(data.get("cookies_file", ""))
@@ -1396,7 +1389,6 @@ class App(tk.Tk):
             "verbose_ydl": bool(self.verbose_ydl_var.get()),
             "mp3gain": bool(self.mp3gain_var.get()),
             "hi_integrity": bool(self.hi_integrity_var.get()),
-            "keep_temp": bool(self.keep_temp_var.get()),
             "playlist_format": self.playlist_format_var.get(),
             "use_run_subdir": bool(self.use_run_subdir_var.get()),
             "cookies_file": self.cookies_file_var.get(),